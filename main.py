@@ -3,12 +3,19 @@
 Main program entry point
 """
 
+import argparse
+
 from src.game import Game
 
 
 def main():
     """Main function"""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Grant Scholar's Survival Kitchen")
+    parser.add_argument("--asset-report", choices=["table", "json"],
+                        help="print the asset cache report on exit (F9 prints it in game)")
+    args = parser.parse_args()
+    
+    game = Game(asset_report=args.asset_report)
     game.run()
 
 
@@ -16,6 +16,7 @@ setup(
             "assets/images/**/*",
             "assets/sounds/**/*",
             "assets/fonts/**/*",
+            "assets/*.bundle",
         ],
     },
     classifiers=[
@@ -2,11 +2,73 @@
 Asset Loader Module
 Singleton pattern asset manager for loading and caching game assets.
 Supports: images, sounds, fonts
+Images, scaled images and sounds share a byte budget with LRU eviction.
+Every cached asset is instrumented for report().
+Assets are read from assets/assets.bundle when it exists, else loose files.
+Decoded images are kept in an on-disk surface cache across launches.
+Images and sounds can be loaded asynchronously: decoding runs on a loader
+thread and finish_loads() converts the results on the main thread.
 """
 
+import io
+import json
 import os
+import time
 import pygame
-from typing import Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from .config import ASSET_CACHE_BUDGET_MB, ASSET_BUNDLE_FILE, ASSET_SURFACE_CACHE_DIR
+from .atlas import ATLAS_DIR, INDEX_FILE, load_index as load_atlas_index
+from .bundle import open_bundle
+from .surface_cache import SurfaceCache
+
+
+# Surface formats chosen by load_image
+FORMAT_OPAQUE = "opaque"      # convert(), no alpha
+FORMAT_COLORKEY = "colorkey"  # convert() + colorkey with RLEACCEL
+FORMAT_ALPHA = "alpha"        # convert_alpha(), per-pixel alpha
+
+# Colorkey candidates, tried in order until one is unused by the image
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3), (254, 1, 253)]
+
+
+class AssetHandle:
+    """
+    Pending result of load_image_async() / load_sound_async().
+    
+    The handle is done once AssetLoader.finish_loads() (called every
+    frame) has converted and cached the asset on the main thread.
+    """
+    
+    def __init__(self, loader: 'AssetLoader', kind: str, path: str, future: Optional[Future] = None,
+                 convert_alpha: bool = True, value=None, scene: Optional[str] = None):
+        self._loader = loader
+        self.kind = kind  # 'image' or 'sound'
+        self.path = path
+        self.future = future  # decode on the loader thread
+        self.convert_alpha = convert_alpha
+        self.value = value
+        self.scene = scene  # scene recorded as the requester in report()
+        self._done = future is None
+    
+    def done(self) -> bool:
+        """Whether the asset is ready to use."""
+        return self._done
+    
+    def result(self):
+        """
+        Get the loaded asset, finishing the load now if necessary.
+        
+        Blocks until the decode is done; call from the main thread only.
+        
+        Returns:
+            pygame.Surface / pygame.mixer.Sound, or None if loading failed
+        """
+        if not self._done:
+            self._loader._complete(self)
+        return self.value
 
 
 class AssetLoader:
@@ -32,6 +94,33 @@ class AssetLoader:
         self._images: Dict[str, pygame.Surface] = {}
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
         self._fonts: Dict[tuple, pygame.font.Font] = {}  # (font_path, size) -> Font
+        self._scaled: Dict[tuple, pygame.Surface] = {}  # (path, size, smooth) -> Surface
+        self._formats: Dict[str, str] = {}  # path -> FORMAT_*
+        self._window_size: Optional[Tuple[int, int]] = None
+        self._atlas: Optional[Dict[str, dict]] = None  # path -> {"sheet", "rect"}, loaded lazily
+        # 打包发布时所有资源来自一个内存映射文件，开发时没有资源包则读散文件
+        self._bundle = (open_bundle(os.path.join(self.assets_path, ASSET_BUNDLE_FILE))
+                        if ASSET_BUNDLE_FILE else None)
+        # 已解码、已转换的像素缓存在磁盘上，下次启动跳过PNG解压
+        self.surface_cache = (SurfaceCache(os.path.join(self.base_path, ASSET_SURFACE_CACHE_DIR))
+                              if ASSET_SURFACE_CACHE_DIR else None)
+        
+        # Byte-budgeted LRU over images, scaled images and sounds
+        self.budget_bytes: Optional[int] = (int(ASSET_CACHE_BUDGET_MB * 1024 * 1024)
+                                            if ASSET_CACHE_BUDGET_MB else None)
+        self._lru: "OrderedDict[tuple, int]" = OrderedDict()  # (kind, key) -> bytes
+        self._cache_bytes = 0
+        self._pinned: set = set()  # asset paths exempt from eviction
+        
+        # Asynchronous loading: one loader thread, handles completed by finish_loads()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._decodes: Dict[tuple, Future] = {}  # (kind, source path) -> decode future
+        self._loading: Dict[tuple, AssetHandle] = {}  # (kind, path) -> pending handle
+        
+        # Instrumentation: (kind, key) -> bytes, load time, hits, last frame, first scene
+        self._stats: Dict[tuple, dict] = {}
+        self.frame = 0
+        self.scene_name: Optional[str] = None
         
         # Ensure pygame is initialized
         if not pygame.get_init():
@@ -43,62 +132,440 @@ class AssetLoader:
         """
         Load an image from assets/images/ directory.
         
+        With convert_alpha the image is inspected once and stored in the
+        cheapest format that draws identically: opaque images are converted
+        without alpha, images whose alpha is only fully on or off get a
+        colorkey with RLEACCEL, and only real translucency keeps per-pixel
+        alpha. The choice is available through get_image_format().
+        
+        Images packed by the atlas build step (python -m src.atlas) are
+        returned as subsurfaces of their atlas sheet instead. Converted
+        pixels are written to the surface cache and reused by later runs
+        until the source file or the display format changes.
+        
         Args:
             path: Relative path within assets/images/ (e.g., 'ui/button.png')
-            convert_alpha: Whether to convert with alpha transparency
-            
+            convert_alpha: Whether the image may keep transparency
+        
         Returns:
             pygame.Surface or None if loading fails
         """
+        entry = self.atlas_entry(path)
         if path in self._images:
+            self._touch('image', path)
+            if entry is not None:
+                self._touch('image', entry['sheet'])
             return self._images[path]
         
+        if entry is not None:
+            image = self._load_from_atlas(path, entry)
+            if image is not None:
+                return image
+        
         full_path = os.path.join(self.assets_path, 'images', path)
         
         try:
-            if not os.path.exists(full_path):
+            decoded = self._decode_image(path, convert_alpha)
+            if decoded is None:
                 print(f"Warning: Image not found: {full_path}")
                 return None
-            
-            image = pygame.image.load(full_path)
-            if convert_alpha:
-                image = image.convert_alpha()
-            else:
-                image = image.convert()
-            
-            self._images[path] = image
-            return image
+            return self._finish_image(path, convert_alpha, decoded)
         except pygame.error as e:
             print(f"Error loading image {full_path}: {e}")
             return None
     
+    def _decode_image(self, path: str, convert_alpha: bool) -> Optional[tuple]:
+        """
+        Read and decode an image without converting it.
+        
+        Touches no loader caches, so it may run on the loader thread.
+        
+        Returns:
+            (surface, surface cache meta or None, source stamp, seconds) or None if missing
+        """
+        started = time.perf_counter()
+        stamp = self._source_stamp('images', path)
+        if stamp is None:
+            return None
+        cached = self.surface_cache.read(self._surface_key(path, convert_alpha), stamp) if self.surface_cache else None
+        if cached is not None:
+            image, meta = cached
+        else:
+            image, meta = pygame.image.load(self._asset_source('images', path), path), None
+        return image, meta, stamp, time.perf_counter() - started
+    
+    def _finish_image(self, path: str, convert_alpha: bool, decoded: tuple) -> pygame.Surface:
+        """Convert a decoded image to the display format and cache it (main thread only)."""
+        image, meta, stamp, seconds = decoded
+        started = time.perf_counter() - seconds
+        if meta is not None:
+            image, image_format = self.surface_cache.convert(image, meta)
+        else:
+            if path.startswith(ATLAS_DIR + '/'):
+                # 图集有透明间隙，必然需要逐像素alpha，跳过格式检测
+                image, image_format = image.convert_alpha(), FORMAT_ALPHA
+            elif convert_alpha:
+                image, image_format = self._optimize_format(image)
+            else:
+                image, image_format = image.convert(), FORMAT_OPAQUE
+            if self.surface_cache:
+                # 像素在主线程读出 (表面此后可能被绘制)，只把写文件交给加载线程
+                cache_key = self._surface_key(path, convert_alpha)
+                entry = self.surface_cache.pack(cache_key, stamp, image, image_format)
+                if entry is not None and self._executor is not None:
+                    self._executor.submit(self.surface_cache.write, cache_key, entry)
+                elif entry is not None:
+                    self.surface_cache.write(cache_key, entry)
+        
+        self._images[path] = image
+        self._formats[path] = image_format
+        self._track('image', path, self._surface_bytes(image), started)
+        return image
+    
+    @staticmethod
+    def _surface_key(path: str, convert_alpha: bool) -> str:
+        return f"{path}|{'alpha' if convert_alpha else 'opaque'}"
+    
+    def load_image_async(self, path: str, convert_alpha: bool = True,
+                         scene: Optional[str] = None) -> AssetHandle:
+        """
+        Start loading an image without blocking.
+        
+        The file is read and decoded on the loader thread; conversion to
+        the display format happens in finish_loads() on the main thread.
+        
+        Args:
+            path: Relative path within assets/images/
+            convert_alpha: Passed through to load_image
+            scene: Scene to record in report(); defaults to the current one
+        
+        Returns:
+            AssetHandle whose result() is the Surface load_image() would return
+        """
+        handle = self._loading.get(('image', path))
+        if handle is not None:
+            return handle
+        entry = self.atlas_entry(path)
+        # 图集中的图片等整张图集解码完成后切出子表面
+        source = entry['sheet'] if entry else path
+        if source in self._images:
+            return AssetHandle(self, 'image', path, value=self.load_image(path, convert_alpha))
+        future = self._submit(('image', source), self._decode_image, source, convert_alpha or entry is not None)
+        handle = self._loading[('image', path)] = AssetHandle(self, 'image', path, future, convert_alpha,
+                                                              scene=scene or self.scene_name)
+        return handle
+    
+    def atlas_entry(self, path: str) -> Optional[dict]:
+        """
+        Get the atlas sheet and sub-rect an image was packed into.
+        
+        Args:
+            path: Relative path within assets/images/
+        
+        Returns:
+            {"sheet": sheet path, "rect": [x, y, w, h]} or None if not packed
+        """
+        if self._atlas is None:
+            data = self._bundle.get(f'images/{ATLAS_DIR}/{INDEX_FILE}') if self._bundle else None
+            self._atlas = load_atlas_index(os.path.join(self.assets_path, 'images'), data)
+        return self._atlas.get(path)
+    
+    def _asset_source(self, category: str, path: str):
+        """
+        Locate an asset in the bundle, falling back to the loose file.
+        
+        Args:
+            category: Asset category ('images', 'sounds', 'fonts')
+            path: Relative path within the category
+        
+        Returns:
+            A file object over the bundled bytes, the loose file path, or None if missing
+        """
+        if self._bundle is not None:
+            data = self._bundle.get(f'{category}/{path}')
+            if data is not None:
+                return io.BytesIO(data)
+        full_path = os.path.join(self.assets_path, category, path)
+        return full_path if os.path.exists(full_path) else None
+    
+    def _source_stamp(self, category: str, path: str) -> Optional[list]:
+        """Identity of an asset's bytes (mtime and size, or bundle position), None if missing."""
+        if self._bundle is not None:
+            stamp = self._bundle.stamp(f'{category}/{path}')
+            if stamp is not None:
+                return stamp
+        try:
+            stat = os.stat(os.path.join(self.assets_path, category, path))
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _asset_size(self, category: str, path: str) -> int:
+        """Size in bytes of an asset file, bundled or loose (0 if missing)."""
+        if self._bundle is not None and f'{category}/{path}' in self._bundle:
+            return self._bundle.size(f'{category}/{path}')
+        full_path = os.path.join(self.assets_path, category, path)
+        return os.path.getsize(full_path) if os.path.exists(full_path) else 0
+    
+    def _load_from_atlas(self, path: str, entry: dict) -> Optional[pygame.Surface]:
+        """Return a packed image as a subsurface of its (cached) atlas sheet."""
+        started = time.perf_counter()
+        sheet = self.load_image(entry['sheet'], convert_alpha=True)
+        if sheet is None:
+            return None
+        try:
+            image = sheet.subsurface(pygame.Rect(entry['rect']))
+        except ValueError as e:
+            print(f"Warning: Bad atlas rect for {path}: {e}")
+            return None
+        
+        self._images[path] = image
+        self._formats[path] = self._formats.get(entry['sheet'])
+        # 子表面共用图集的像素内存，不单独计数
+        self._track('image', path, 0, started)
+        return image
+    
+    def _optimize_format(self, image: pygame.Surface) -> Tuple[pygame.Surface, str]:
+        """
+        Pick the cheapest display format for a loaded image.
+        
+        Args:
+            image: Surface as returned by pygame.image.load
+        
+        Returns:
+            (converted surface, FORMAT_* name)
+        """
+        if not image.get_flags() & pygame.SRCALPHA and image.get_colorkey() is None:
+            return image.convert(), FORMAT_OPAQUE
+        
+        image = image.convert_alpha()
+        area = image.get_width() * image.get_height()
+        # alpha == 255 的像素 / alpha > 0 的像素
+        solid = pygame.mask.from_surface(image, 254)
+        visible = pygame.mask.from_surface(image, 0)
+        solid_count = solid.count()
+        if solid_count == area:
+            return image.convert(), FORMAT_OPAQUE
+        if visible.count() != solid_count:
+            # 存在半透明像素，保留逐像素alpha
+            return image, FORMAT_ALPHA
+        
+        # 只有全透明/全不透明: 找一个实心像素未使用的颜色作为colorkey
+        for key in COLORKEY_CANDIDATES:
+            used = pygame.mask.from_threshold(image, key, (1, 1, 1, 255))
+            if solid.overlap_area(used, (0, 0)) == 0:
+                keyed = pygame.Surface(image.get_size()).convert()
+                keyed.fill(key)
+                keyed.blit(image, (0, 0))
+                keyed.set_colorkey(key, pygame.RLEACCEL)
+                return keyed, FORMAT_COLORKEY
+        return image, FORMAT_ALPHA
+    
+    def get_image_format(self, path: str) -> Optional[str]:
+        """
+        Get the surface format chosen for a loaded image.
+        
+        Args:
+            path: Relative path within assets/images/
+        
+        Returns:
+            FORMAT_OPAQUE, FORMAT_COLORKEY, FORMAT_ALPHA, or None if not loaded
+        """
+        return self._formats.get(path)
+    
+    def image_formats(self) -> Dict[str, str]:
+        """Chosen surface format for every loaded image, keyed by path."""
+        return dict(self._formats)
+    
+    def load_scaled_image(self, path: str, size: Tuple[int, int], smooth: bool = False,
+                          convert_alpha: bool = True) -> Optional[pygame.Surface]:
+        """
+        Load an image and return a copy scaled to the given size.
+        
+        Scaled results are cached by (path, size, smooth), so callers that
+        draw the same backdrop every frame only pay for the resample once.
+        The cache is dropped when the window size changes.
+        
+        Args:
+            path: Relative path within assets/images/
+            size: Target (width, height) in pixels
+            smooth: Use smoothscale instead of nearest-neighbour scaling
+            convert_alpha: Passed through to load_image
+        
+        Returns:
+            pygame.Surface or None if loading fails
+        """
+        size = (int(size[0]), int(size[1]))
+        cache_key = (path, size, smooth)
+        if cache_key in self._scaled:
+            self._touch('scaled', cache_key)
+            return self._scaled[cache_key]
+        
+        image = self.load_image(path, convert_alpha=convert_alpha)
+        if image is None:
+            return None
+        
+        started = time.perf_counter()
+        if image.get_size() == size:
+            scaled = image
+        elif smooth:
+            if image.get_colorkey() is not None:
+                # 平滑缩放会把colorkey颜色混进边缘，先转为逐像素alpha
+                image = image.convert_alpha()
+            scaled = pygame.transform.smoothscale(image, size)
+        else:
+            scaled = pygame.transform.scale(image, size)
+        
+        self._scaled[cache_key] = scaled
+        # 与原图是同一个表面时不重复计数
+        self._track('scaled', cache_key, 0 if scaled is image else self._surface_bytes(scaled), started)
+        return scaled
+    
+    def set_window_size(self, size: Tuple[int, int]):
+        """
+        Notify the loader of the current window size.
+        
+        Scaled surfaces are only invalidated when the size actually changes.
+        
+        Args:
+            size: Window (width, height) in pixels
+        """
+        size = (int(size[0]), int(size[1]))
+        if size != self._window_size:
+            self._window_size = size
+            self.invalidate_scaled_cache()
+    
+    def invalidate_scaled_cache(self):
+        """Drop all cached scaled surfaces."""
+        for cache_key in list(self._scaled):
+            self._drop('scaled', cache_key)
+    
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
         """
         Load a sound from assets/sounds/ directory.
         
         Args:
             path: Relative path within assets/sounds/ (e.g., 'sfx/click.wav')
-            
+        
         Returns:
             pygame.mixer.Sound or None if loading fails
         """
         if path in self._sounds:
+            self._touch('sound', path)
             return self._sounds[path]
         
         full_path = os.path.join(self.assets_path, 'sounds', path)
         
         try:
-            if not os.path.exists(full_path):
+            decoded = self._decode_sound(path)
+            if decoded is None:
                 print(f"Warning: Sound not found: {full_path}")
                 return None
-            
-            sound = pygame.mixer.Sound(full_path)
-            self._sounds[path] = sound
-            return sound
+            return self._finish_sound(path, decoded)
         except pygame.error as e:
             print(f"Error loading sound {full_path}: {e}")
             return None
     
+    def _decode_sound(self, path: str) -> Optional[tuple]:
+        """Decode a sound; may run on the loader thread. Returns (sound, seconds) or None if missing."""
+        started = time.perf_counter()
+        source = self._asset_source('sounds', path)
+        if source is None:
+            return None
+        return pygame.mixer.Sound(source), time.perf_counter() - started
+    
+    def _finish_sound(self, path: str, decoded: tuple) -> pygame.mixer.Sound:
+        """Cache a decoded sound (main thread only)."""
+        sound, seconds = decoded
+        self._sounds[path] = sound
+        self._track('sound', path, self._sound_bytes(sound), time.perf_counter() - seconds)
+        return sound
+    
+    def load_sound_async(self, path: str, scene: Optional[str] = None) -> AssetHandle:
+        """
+        Start loading a sound without blocking.
+        
+        Args:
+            path: Relative path within assets/sounds/
+            scene: Scene to record in report(); defaults to the current one
+        
+        Returns:
+            AssetHandle whose result() is the Sound load_sound() would return
+        """
+        if path in self._sounds:
+            return AssetHandle(self, 'sound', path, value=self.load_sound(path))
+        handle = self._loading.get(('sound', path))
+        if handle is None:
+            future = self._submit(('sound', path), self._decode_sound, path)
+            handle = self._loading[('sound', path)] = AssetHandle(self, 'sound', path, future,
+                                                                  scene=scene or self.scene_name)
+        return handle
+    
+    def _submit(self, key: tuple, decode, *args) -> Future:
+        """Queue a decode on the loader thread; requests for the same source share it."""
+        future = self._decodes.get(key)
+        if future is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asset-loader")
+            future = self._decodes[key] = self._executor.submit(decode, *args)
+        return future
+    
+    def finish_loads(self) -> int:
+        """
+        Complete asynchronous loads whose decode has finished.
+        
+        Call once per frame on the main thread.
+        
+        Returns:
+            Number of handles completed
+        """
+        finished = [handle for handle in self._loading.values() if handle.future.done()]
+        for handle in finished:
+            self._complete(handle)
+        return len(finished)
+    
+    @property
+    def loading(self) -> int:
+        """Number of asynchronous loads not completed yet."""
+        return len(self._loading)
+    
+    def _complete(self, handle: AssetHandle):
+        """Main-thread half of an asynchronous load: convert, cache and resolve the handle."""
+        self._loading.pop((handle.kind, handle.path), None)
+        entry = self.atlas_entry(handle.path) if handle.kind == 'image' else None
+        source = entry['sheet'] if entry else handle.path
+        self._decodes.pop((handle.kind, source), None)
+        try:
+            decoded = handle.future.result()
+        except (pygame.error, OSError) as e:
+            print(f"Error loading {handle.kind} {source}: {e}")
+            decoded = None
+        else:
+            if decoded is None:
+                print(f"Warning: {handle.kind.capitalize()} not found: {source}")
+        
+        # 统计记为发起请求的场景，而不是完成时的当前场景 (如加载界面)
+        scene_name, self.scene_name = self.scene_name, handle.scene
+        try:
+            if handle.kind == 'sound':
+                if decoded is not None and source not in self._sounds:
+                    self._finish_sound(source, decoded)
+                handle.value = self._sounds.get(source)
+            else:
+                if decoded is not None and source not in self._images:
+                    self._finish_image(source, handle.convert_alpha or entry is not None, decoded)
+                if source in self._images:
+                    handle.value = (self.load_image(handle.path, handle.convert_alpha) if entry
+                                    else self._images[source])
+        except pygame.error as e:
+            # 与同步的 load_image 一致: 转换失败时打印错误，句柄结果为None
+            print(f"Error loading {handle.kind} {source}: {e}")
+            handle.value = None
+        finally:
+            self.scene_name = scene_name
+            # 失败也算完成，加载界面的进度才能到达100%
+            handle._done = True
+    
     def load_font(self, path: Optional[str] = None, size: int = 24) -> pygame.font.Font:
         """
         Load a font from assets/fonts/ directory.
@@ -107,32 +574,36 @@ class AssetLoader:
             path: Relative path within assets/fonts/ (e.g., 'game_font.ttf')
                   If None, uses pygame's default font
             size: Font size in pixels
-            
+        
         Returns:
             pygame.font.Font object
         """
         cache_key = (path, size)
         if cache_key in self._fonts:
+            self._record_hit('font', cache_key)
             return self._fonts[cache_key]
         
+        started = time.perf_counter()
         try:
             if path is None:
                 font = pygame.font.Font(None, size)
             else:
-                full_path = os.path.join(self.assets_path, 'fonts', path)
-                if not os.path.exists(full_path):
+                source = self._asset_source('fonts', path)
+                if source is None:
+                    full_path = os.path.join(self.assets_path, 'fonts', path)
                     print(f"Warning: Font not found: {full_path}, using default font")
                     font = pygame.font.Font(None, size)
                 else:
-                    font = pygame.font.Font(full_path, size)
-            
-            self._fonts[cache_key] = font
-            return font
+                    font = pygame.font.Font(source, size)
         except pygame.error as e:
             print(f"Error loading font: {e}, using default font")
             font = pygame.font.Font(None, size)
-            self._fonts[cache_key] = font
-            return font
+        
+        self._fonts[cache_key] = font
+        # 字体内存无法直接获取，按字体文件大小估算
+        nbytes = self._asset_size('fonts', path) if path else 0
+        self._record_load('font', cache_key, nbytes, started)
+        return font
     
     def get_asset_path(self, category: str, filename: str) -> str:
         """
@@ -141,7 +612,7 @@ class AssetLoader:
         Args:
             category: Asset category ('images', 'sounds', 'fonts')
             filename: Filename within the category
-            
+        
         Returns:
             Full absolute path to the asset
         """
@@ -150,8 +621,209 @@ class AssetLoader:
     def clear_cache(self):
         """Clear all cached assets to free memory."""
         self._images.clear()
+        self._formats.clear()
+        self._scaled.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._lru.clear()
+        self._cache_bytes = 0
+        self._stats.clear()
+        self._atlas = None
+    
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        """Pixel memory of a surface (width x height x bytes per pixel)."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    
+    @staticmethod
+    def _sound_bytes(sound: pygame.mixer.Sound) -> int:
+        """Raw sample memory of a sound at the mixer's format."""
+        mixer_format = pygame.mixer.get_init()
+        if not mixer_format:
+            return 0
+        frequency, sample_format, channels = mixer_format
+        return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+    
+    def _cache_for(self, kind: str) -> dict:
+        return {'image': self._images, 'scaled': self._scaled, 'sound': self._sounds}[kind]
+    
+    def _asset_path(self, kind: str, key) -> str:
+        """Asset path an LRU entry belongs to (used for pinning)."""
+        return key[0] if kind == 'scaled' else key
+    
+    def _touch(self, kind: str, key):
+        """Mark an entry as most recently used."""
+        if (kind, key) in self._lru:
+            self._lru.move_to_end((kind, key))
+        self._record_hit(kind, key)
+    
+    def _track(self, kind: str, key, nbytes: int, started: float):
+        """Account for a newly cached entry and evict if over budget."""
+        self._lru[(kind, key)] = nbytes
+        self._cache_bytes += nbytes
+        self._record_load(kind, key, nbytes, started)
+        self._evict()
+    
+    def _record_load(self, kind: str, key, nbytes: int, started: float):
+        """Record a (re)load; the first requesting scene is kept across evictions."""
+        stats = self._stats.setdefault((kind, key), {
+            'hits': 0, 'loads': 0, 'scene': self.scene_name,
+        })
+        stats['bytes'] = nbytes
+        stats['load_ms'] = (time.perf_counter() - started) * 1000
+        stats['loads'] += 1
+        stats['last_frame'] = self.frame
+    
+    def _record_hit(self, kind: str, key):
+        stats = self._stats.get((kind, key))
+        if stats is not None:
+            stats['hits'] += 1
+            stats['last_frame'] = self.frame
+    
+    def set_context(self, frame: int, scene_name: Optional[str]):
+        """
+        Tell the loader the current frame number and active scene.
+        
+        Args:
+            frame: Frame counter, stored as the last-access frame of assets
+            scene_name: Scene name recorded for assets loaded from now on
+        """
+        self.frame = frame
+        self.scene_name = scene_name
+    
+    def report(self, fmt: str = 'table') -> str:
+        """
+        Describe every asset the loader has cached, largest first.
+        
+        Args:
+            fmt: 'table' for a text table, 'json' for a JSON document
+        
+        Returns:
+            The report as a string
+        """
+        rows = []
+        for (kind, key), stats in self._stats.items():
+            if kind == 'scaled':
+                name = f"{key[0]} @{key[1][0]}x{key[1][1]}" + (" smooth" if key[2] else "")
+            elif kind == 'font':
+                name = f"{key[0] or '<default>'} @{key[1]}"
+            else:
+                name = key
+            cached = (key in self._fonts) if kind == 'font' else ((kind, key) in self._lru)
+            rows.append({
+                'kind': kind,
+                'name': name,
+                'bytes': stats['bytes'],
+                'load_ms': round(stats['load_ms'], 2),
+                'loads': stats['loads'],
+                'hits': stats['hits'],
+                'last_frame': stats['last_frame'],
+                'scene': stats['scene'],
+                'cached': cached,
+                'pinned': kind != 'font' and self._asset_path(kind, key) in self._pinned,
+            })
+        rows.sort(key=lambda row: row['bytes'], reverse=True)
+        
+        if fmt == 'json':
+            return json.dumps({
+                'frame': self.frame,
+                'cache_bytes': self._cache_bytes,
+                'budget_bytes': self.budget_bytes,
+                'assets': rows,
+            }, indent=2)
+        
+        budget = f"{self.budget_bytes / 1024:.0f} KB" if self.budget_bytes else "unlimited"
+        lines = [f"Asset cache: {self._cache_bytes / 1024:.0f} KB of {budget}, frame {self.frame}",
+                 f"{'kind':<7}{'KB':>9}{'load ms':>9}{'loads':>6}{'hits':>7}{'last':>7}  "
+                 f"{'scene':<14}{'state':<8}name"]
+        for row in rows:
+            state = ('pinned' if row['pinned'] else 'cached') if row['cached'] else 'evicted'
+            lines.append(f"{row['kind']:<7}{row['bytes'] / 1024:>9.1f}{row['load_ms']:>9.2f}"
+                         f"{row['loads']:>6}{row['hits']:>7}{row['last_frame']:>7}  "
+                         f"{row['scene'] or '-':<14}{state:<8}{row['name']}")
+        return "\n".join(lines)
+    
+    def _drop(self, kind: str, key):
+        """Remove an entry from its cache and from the byte accounting."""
+        self._cache_for(kind).pop(key, None)
+        self._cache_bytes -= self._lru.pop((kind, key), 0)
+        if kind == 'image':
+            self._formats.pop(key, None)
+            # 与原图共用表面的缩放条目一并移除
+            for cache_key in [k for k in self._scaled if k[0] == key and self._lru.get(('scaled', k)) == 0]:
+                self._drop('scaled', cache_key)
+            # 图集被淘汰时，从它切出的子表面也一并移除
+            if self._atlas:
+                for path in [p for p in self._images if (self._atlas.get(p) or {}).get('sheet') == key]:
+                    self._drop('image', path)
+    
+    def _evict(self):
+        """Evict least recently used, unpinned entries until within budget."""
+        if self.budget_bytes is None or self._cache_bytes <= self.budget_bytes:
+            return
+        for kind, key in list(self._lru):
+            if self._cache_bytes <= self.budget_bytes:
+                break
+            if self._asset_path(kind, key) in self._pinned:
+                continue
+            self._drop(kind, key)
+    
+    def set_budget(self, budget_bytes: Optional[int]):
+        """
+        Change the cache budget and evict down to it.
+        
+        Args:
+            budget_bytes: Maximum bytes held by cached assets, None for unlimited
+        """
+        self.budget_bytes = budget_bytes
+        self._evict()
+    
+    def set_pinned(self, paths: Iterable[str]):
+        """
+        Replace the set of pinned asset paths.
+        
+        Pinned images (with their scaled variants) and sounds are never
+        evicted; typically the paths referenced by the active scene.
+        
+        Args:
+            paths: Relative asset paths to pin
+        """
+        paths = set(paths)
+        # 图集中的图片连同所在图集一起固定
+        paths |= {entry['sheet'] for entry in map(self.atlas_entry, list(paths)) if entry}
+        if paths != self._pinned:
+            self._pinned = paths
+            self._evict()
+    
+    @property
+    def cache_bytes(self) -> int:
+        """Bytes currently held by budgeted caches."""
+        return self._cache_bytes
+    
+    def preload_assets_async(self, asset_list: Dict[str, list]) -> list:
+        """
+        Start loading a batch of assets without blocking.
+        
+        Images and sounds are decoded on the loader thread; fonts are
+        loaded immediately.
+        
+        Args:
+            asset_list: Same layout as preload_assets(), plus an optional
+                        'scenes' dict mapping asset paths to the scene
+                        recorded as their requester in report()
+        
+        Returns:
+            List of AssetHandle, one per image and sound
+        """
+        scenes = asset_list.get('scenes', {})
+        handles = [self.load_image_async(path, scene=scenes.get(path)) for path in asset_list.get('images', [])]
+        handles += [self.load_sound_async(path, scene=scenes.get(path)) for path in asset_list.get('sounds', [])]
+        for font_info in asset_list.get('fonts', []):
+            if isinstance(font_info, (tuple, list)):
+                self.load_font(*font_info)
+            else:
+                self.load_font(font_info)
+        return handles
     
     def preload_assets(self, asset_list: Dict[str, list]):
         """
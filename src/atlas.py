@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Texture atlas packer
+Packs the small sprites of whole image directories into a few large sheets
+plus a JSON index of sub-rects, which AssetLoader.load_image reads from
+
+Usage:
+    python -m src.atlas                 # pack items/ and ui/
+    python -m src.atlas items --max-size 1024
+"""
+
+import argparse
+import json
+import os
+
+import pygame
+
+# 打包结果位于 assets/images/atlas/
+ATLAS_DIR = "atlas"
+INDEX_FILE = "index.json"
+DEFAULT_DIRS = ("items", "ui")
+
+
+def pack_rects(sizes, max_size=2048, padding=1):
+    """
+    Shelf-pack rectangles into as few sheets as needed
+    
+    Args:
+        sizes: {name: (width, height)}
+        max_size: Maximum sheet width and height
+        padding: Transparent gap around every rect (avoids bleeding when scaled)
+    
+    Returns:
+        List of sheets, each {"size": [w, h], "rects": {name: [x, y, w, h]}}
+    """
+    sheets = []
+    # 按高度从高到低排序，货架式排布浪费最少
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    sheet = None
+    for name in order:
+        width, height = sizes[name]
+        if width + padding * 2 > max_size or height + padding * 2 > max_size:
+            raise ValueError(f"{name} ({width}x{height}) does not fit in a {max_size}px sheet")
+        
+        if sheet is not None and sheet["x"] + width + padding * 2 > max_size:
+            # 换到下一排货架
+            sheet["y"] += sheet["shelf"]
+            sheet["x"] = 0
+            sheet["shelf"] = 0
+        if sheet is None or sheet["y"] + height + padding * 2 > max_size:
+            sheet = {"x": 0, "y": 0, "shelf": 0, "width": 0, "rects": {}}
+            sheets.append(sheet)
+        
+        sheet["rects"][name] = [sheet["x"] + padding, sheet["y"] + padding, width, height]
+        sheet["x"] += width + padding * 2
+        sheet["shelf"] = max(sheet["shelf"], height + padding * 2)
+        sheet["width"] = max(sheet["width"], sheet["x"])
+    
+    return [{"size": [sheet["width"], sheet["y"] + sheet["shelf"]], "rects": sheet["rects"]}
+            for sheet in sheets]
+
+
+def _copy_pixels(sheet, image, pos):
+    """Copy an image into the transparent sheet without alpha blending"""
+    if image.get_flags() & pygame.SRCALPHA:
+        # MAX混合到全透明底色上等于原样拷贝 (含alpha)
+        sheet.blit(image, pos, special_flags=pygame.BLEND_RGBA_MAX)
+    else:
+        # 不透明或colorkey图片: 普通blit即可 (colorkey像素保持透明)
+        sheet.blit(image, pos)
+
+
+def build_atlases(images_path, dirs=DEFAULT_DIRS, max_size=2048, padding=1):
+    """
+    Pack every PNG under images_path/<dir> into sheets under images_path/atlas
+    
+    Args:
+        images_path: The assets/images directory
+        dirs: Subdirectories to pack, one set of sheets per directory
+        max_size: Maximum sheet width and height
+        padding: Transparent gap around every sprite
+    
+    Returns:
+        The index written to atlas/index.json
+    """
+    output_path = os.path.join(images_path, ATLAS_DIR)
+    os.makedirs(output_path, exist_ok=True)
+    # 保留未重新打包目录的条目
+    index = {"padding": padding, "images": {
+        path: entry for path, entry in load_index(images_path).items()
+        if path.split("/", 1)[0] not in dirs
+    }}
+    
+    for directory in dirs:
+        for filename in os.listdir(output_path):
+            if filename.startswith(f"{directory}_") and filename.endswith(".png"):
+                os.remove(os.path.join(output_path, filename))
+        images = {}
+        for filename in sorted(os.listdir(os.path.join(images_path, directory))):
+            if filename.lower().endswith(".png"):
+                path = f"{directory}/{filename}"
+                images[path] = pygame.image.load(os.path.join(images_path, directory, filename))
+        if not images:
+            continue
+        
+        sheets = pack_rects({path: image.get_size() for path, image in images.items()},
+                            max_size, padding)
+        for number, sheet in enumerate(sheets):
+            sheet_path = f"{ATLAS_DIR}/{directory}_{number}.png"
+            surface = pygame.Surface(sheet["size"], pygame.SRCALPHA)
+            for path, rect in sheet["rects"].items():
+                _copy_pixels(surface, images[path], rect[:2])
+                index["images"][path] = {"sheet": sheet_path, "rect": rect}
+            pygame.image.save(surface, os.path.join(images_path, sheet_path))
+            print(f"{sheet_path}: {len(sheet['rects'])} images, {sheet['size'][0]}x{sheet['size'][1]}")
+    
+    with open(os.path.join(output_path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return index
+
+
+def load_index(images_path, data=None):
+    """Read atlas/index.json, or its bytes from an asset bundle; returns {} when no atlas has been built"""
+    index_path = os.path.join(images_path, ATLAS_DIR, INDEX_FILE)
+    if data is None and not os.path.exists(index_path):
+        return {}
+    try:
+        if data is not None:
+            return json.loads(bytes(data).decode("utf-8")).get("images", {})
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f).get("images", {})
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read atlas index {index_path}: {e}")
+        return {}
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Pack sprite directories into texture atlases")
+    parser.add_argument("dirs", nargs="*", default=list(DEFAULT_DIRS),
+                        help="directories under assets/images to pack (default: items ui)")
+    parser.add_argument("--max-size", type=int, default=2048, help="maximum sheet size in pixels")
+    parser.add_argument("--padding", type=int, default=1, help="transparent gap around each sprite")
+    args = parser.parse_args()
+    
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    build_atlases(os.path.join(base_path, "assets", "images"), args.dirs, args.max_size, args.padding)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Packed asset bundle
+A single file holding every asset under assets/, read through mmap so a
+packaged install needs one open instead of a stat and open per asset
+
+Layout: MAGIC, version and index length (little-endian uint32), the JSON
+index {path: [offset, length, format]}, then the raw asset files. Paths
+are relative to assets/ ("images/items/egg.png"); offsets are absolute.
+
+Usage:
+    python -m src.bundle                # writes assets/assets.bundle
+    python -m src.bundle -o build/assets.bundle
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+
+from .atlas import ATLAS_DIR, INDEX_FILE, load_index as load_atlas_index
+
+MAGIC = b"GSKB"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+BUNDLE_FILE = "assets.bundle"
+
+# 与 MANIFEST.in 一致的资源扩展名
+ASSET_EXTENSIONS = {
+    "images": (".png", ".jpg", ".jpeg", ".gif", ".bmp"),
+    "sounds": (".wav", ".mp3", ".ogg"),
+    "fonts": (".ttf", ".otf"),
+}
+
+
+class AssetBundle:
+    """Read-only, memory-mapped view of a bundle file
+    
+    get() returns a memoryview slice of the mapping, so nothing is read
+    from disk until a decoder touches the bytes.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_length = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"not a version {VERSION} asset bundle")
+            index = self._mmap[HEADER.size:HEADER.size + index_length]
+            self.index = json.loads(index.decode("utf-8"))
+        except (struct.error, ValueError):
+            self._mmap.close()
+            raise
+        self._view = memoryview(self._mmap)
+    
+    def __contains__(self, path):
+        return path in self.index
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def get(self, path):
+        """memoryview of an asset's bytes, or None if it is not bundled"""
+        entry = self.index.get(path)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        return self._view[offset:offset + length]
+    
+    def format(self, path):
+        """Format (file extension without the dot) of a bundled asset"""
+        entry = self.index.get(path)
+        return entry[2] if entry else None
+    
+    def size(self, path):
+        """Byte length of a bundled asset, or None"""
+        entry = self.index.get(path)
+        return entry[1] if entry else None
+    
+    def stamp(self, path):
+        """Identity of a bundled asset's bytes: [bundle mtime, offset, length], or None"""
+        entry = self.index.get(path)
+        return [self.mtime_ns, entry[0], entry[1]] if entry else None
+    
+    def close(self):
+        """Release the mapping; views returned by get() become invalid"""
+        self._view.release()
+        self._mmap.close()
+
+
+def open_bundle(path):
+    """Open a bundle file; returns None if it is missing or unreadable"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return AssetBundle(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not open asset bundle {path}: {e}")
+        return None
+
+
+def collect_assets(assets_path):
+    """
+    List the files a bundle should contain
+    
+    Images that are packed into an atlas are skipped: the loader serves
+    them from the atlas sheets, which are bundled instead.
+    
+    Returns:
+        Sorted list of paths relative to assets_path, using "/" separators
+    """
+    packed = set(load_atlas_index(os.path.join(assets_path, "images")))
+    paths = []
+    for category, extensions in ASSET_EXTENSIONS.items():
+        root = os.path.join(assets_path, category)
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.lower().endswith(extensions):
+                    continue
+                relative = os.path.relpath(os.path.join(directory, filename), root).replace(os.sep, "/")
+                if category == "images" and relative in packed:
+                    continue
+                paths.append(f"{category}/{relative}")
+    # 图集索引也放进资源包
+    atlas_index = os.path.join(assets_path, "images", ATLAS_DIR, INDEX_FILE)
+    if os.path.exists(atlas_index):
+        paths.append(f"images/{ATLAS_DIR}/{INDEX_FILE}")
+    return sorted(paths)
+
+
+def build_bundle(assets_path, output_path):
+    """
+    Write every asset under assets_path into one bundle file
+    
+    Returns:
+        The bundle index {path: [offset, length, format]}
+    """
+    paths = collect_assets(assets_path)
+    sizes = {path: os.path.getsize(os.path.join(assets_path, *path.split("/"))) for path in paths}
+    
+    # 索引长度取决于偏移量，偏移量又取决于索引长度: 迭代到稳定为止
+    index_length = 0
+    while True:
+        offset = HEADER.size + index_length
+        index = {}
+        for path in paths:
+            index[path] = [offset, sizes[path], os.path.splitext(path)[1][1:].lower()]
+            offset += sizes[path]
+        encoded = json.dumps(index, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        if len(encoded) == index_length:
+            break
+        index_length = len(encoded)
+    
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, index_length))
+        f.write(encoded)
+        for path in paths:
+            with open(os.path.join(assets_path, *path.split("/")), "rb") as source:
+                f.write(source.read())
+    os.replace(temp_path, output_path)
+    print(f"{output_path}: {len(paths)} assets, {os.path.getsize(output_path) / 1024:.0f} KB")
+    return index
+
+
+def main():
+    """Command line entry point"""
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assets_path = os.path.join(base_path, "assets")
+    parser = argparse.ArgumentParser(description="Pack the assets directory into a single bundle file")
+    parser.add_argument("-o", "--output", default=os.path.join(assets_path, BUNDLE_FILE),
+                        help=f"bundle file to write (default: assets/{BUNDLE_FILE})")
+    args = parser.parse_args()
+    build_bundle(assets_path, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Layer compositor
+Splits a scene into ordered layers; static layers are rendered once into
+cached surfaces and baked together, dynamic layers are drawn every frame
+"""
+
+import pygame
+
+
+class Layer:
+    """A single drawing layer of a scene"""
+    
+    def __init__(self, name, draw_func, static=False):
+        self.name = name
+        self.draw_func = draw_func  # draw_func(surface)
+        self.static = static
+        self.surface = None
+        self.dirty = True
+    
+    def invalidate(self):
+        """Mark the layer for re-rendering on the next draw"""
+        self.dirty = True
+    
+    def render(self, size):
+        """Render a static layer into its cached surface"""
+        # 每次重建新表面，缓存表面视为不可变 (纹理渲染器按表面缓存纹理)
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.draw_func(self.surface)
+        self.dirty = False
+
+
+class LayerCompositor:
+    """Composites ordered layers onto a target surface"""
+    
+    def __init__(self, size):
+        self.size = tuple(size)
+        self.layers = []
+        self._base = None  # 底部连续静态层合成后的缓存
+        self._base_dirty = True
+    
+    def add_layer(self, name, draw_func, static=False):
+        """Append a layer on top of the existing ones"""
+        layer = Layer(name, draw_func, static)
+        self.layers.append(layer)
+        self._base_dirty = True
+        return layer
+    
+    def get_layer(self, name):
+        """Get layer by name"""
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+    
+    def invalidate(self, name=None):
+        """Invalidate one layer by name, or every layer if name is None"""
+        for layer in self.layers:
+            if name is None or layer.name == name:
+                layer.invalidate()
+    
+    def resize(self, size):
+        """Change the composite size, rebuilding all static layers"""
+        size = tuple(size)
+        if size != self.size:
+            self.size = size
+            self._base = None
+            self.invalidate()
+    
+    def _base_layers(self):
+        """Static layers at the bottom of the stack, baked into one surface"""
+        base = []
+        for layer in self.layers:
+            if not layer.static:
+                break
+            base.append(layer)
+        return base
+    
+    def _rebuild_base(self, base_layers):
+        """Re-render dirty static layers and re-bake the base surface"""
+        self._base = pygame.Surface(self.size).convert()
+        for layer in base_layers:
+            if layer.dirty:
+                layer.render(self.size)
+            self._base.blit(layer.surface, (0, 0))
+        self._base_dirty = False
+    
+    def draw(self, surface):
+        """
+        Draw all layers onto the surface
+        surface may also be a RenderQueue; dynamic layers must then only blit
+        """
+        base_layers = self._base_layers()
+        if base_layers:
+            if self._base_dirty or any(layer.dirty for layer in base_layers):
+                self._rebuild_base(base_layers)
+            surface.blit(self._base, (0, 0))
+        
+        for layer in self.layers[len(base_layers):]:
+            if layer.static:
+                # 位于动态层之上的静态层无法烘焙，直接贴缓存
+                if layer.dirty:
+                    layer.render(self.size)
+                surface.blit(layer.surface, (0, 0))
+            else:
+                layer.draw_func(surface)
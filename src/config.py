@@ -13,6 +13,38 @@ WINDOW_HEIGHT = data_loader.get("config", "window", "height", default=768)
 FPS = data_loader.get("config", "window", "fps", default=60)
 TITLE = data_loader.get("config", "window", "title", default="Grant Scholar's Survival Kitchen")
 
+# Render settings ("surface" 软件渲染 / "texture" SDL2纹理渲染)
+RENDER_BACKEND = data_loader.get("config", "render", "backend", default="surface")
+LOG_FRAME_TIME = data_loader.get("config", "render", "log_frame_time", default=False)
+DIRTY_RECTS = data_loader.get("config", "render", "dirty_rects", default=False)
+TEXT_CACHE_SIZE = data_loader.get("config", "render", "text_cache_size", default=512)
+STORY_PREFETCH_PAGES = data_loader.get("config", "render", "story_prefetch_pages", default=4)
+# 内部帧缓冲: 场景按窗口尺寸绘制，再整数倍最近邻放大到显示窗口
+PIXEL_SCALE = max(1, int(data_loader.get("config", "render", "pixel_scale", default=1)))
+USE_SCALED_FLAG = data_loader.get("config", "render", "use_scaled_flag", default=False)
+
+# Main loop settings ("fixed" 固定帧率 / "adaptive" 空闲时阻塞等待事件)
+LOOP_MODE = data_loader.get("config", "loop", "mode", default="fixed")
+ANIMATION_FPS = data_loader.get("config", "loop", "animation_fps", default=FPS)
+INTERACTIVE_FPS = data_loader.get("config", "loop", "interactive_fps", default=30)
+IDLE_FPS = data_loader.get("config", "loop", "idle_fps", default=4)
+INTERACTIVE_HOLD_MS = data_loader.get("config", "loop", "interactive_hold_ms", default=500)
+# 每帧留给空闲任务之外的余量 (ms)
+IDLE_MARGIN_MS = data_loader.get("config", "loop", "idle_margin_ms", default=2)
+
+# Scene transition duration in ms (0 切换场景时直接切)
+TRANSITION_MS = data_loader.get("config", "transition", "duration_ms", default=300)
+
+# Asset cache budget in MB for images, scaled images and sounds (null = unlimited)
+ASSET_CACHE_BUDGET_MB = data_loader.get("config", "assets", "cache_budget_mb", default=None)
+# Packed asset bundle under assets/ (python -m src.bundle; 文件不存在时读散文件, null 禁用)
+ASSET_BUNDLE_FILE = data_loader.get("config", "assets", "bundle_file", default=None)
+# Decoded surface cache directory, relative to the project root (null 禁用)
+ASSET_SURFACE_CACHE_DIR = data_loader.get("config", "assets", "surface_cache_dir", default=None)
+
+# Input settings (命中检测网格的格子边长)
+HIT_GRID_CELL = data_loader.get("config", "input", "hit_grid_cell", default=64)
+
 # Colors
 def get_color(name):
     """Get color tuple from configuration"""
@@ -36,6 +68,9 @@ START_MONTH = data_loader.get("config", "game", "start_month", default=12)
 START_DAY = data_loader.get("config", "game", "start_day", default=2)
 TIME_PERIODS = data_loader.get("config", "game", "time_periods", default=[])
 
+# Background colour grade per time period ({"multiply": [r, g, b], "add": [r, g, b]})
+PERIOD_LIGHTING = data_loader.get("config", "lighting", default={})
+
 # Stat settings
 STAT_MIN = data_loader.get("stats", "stat_ranges", "min", default=0)
 STAT_MAX = data_loader.get("stats", "stat_ranges", "max", default=100)
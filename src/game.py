@@ -6,19 +6,32 @@ Manages game flow, time period switching, scene switching
 
 import pygame
 import sys
+import time
 from .config import *
+from .data_loader import data_loader
 from .player import Player
 from .events import EventSystem
-from .scenes import MainScene, ShoppingScene, KitchenScene, StoryScene
+from .asset_loader import asset_loader
+from .renderer import create_renderer, merge_rects
+from .input import InputDispatcher
+from .transitions import Transition, snapshot_scene
+from .lighting import lighting
+from .scheduler import idle_scheduler
+from .backgrounds import BACKGROUND_IMAGES, prewarm_backgrounds
+from .scenes import MainScene, ShoppingScene, KitchenScene, StoryScene, LoadingScene
 
 
 class Game:
     """Game main class"""
     
-    def __init__(self):
+    def __init__(self, asset_report=None):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption(TITLE)
+        self.asset_report = asset_report  # "table"/"json": print the asset report on exit
+        self.renderer = create_renderer((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = self.renderer.screen
+        asset_loader.set_window_size(self.screen.get_size())
+        self.input = InputDispatcher()
+        self.input.install()
         self.clock = pygame.time.Clock()
         self.running = True
         
@@ -31,16 +44,46 @@ class Game:
         self.shopping_scene = ShoppingScene(self)
         self.kitchen_scene = KitchenScene(self)
         self.story_scene = StoryScene(self)
+        self.loading_scene = LoadingScene(self)
         self.current_scene = self.main_scene
         self.previous_scene = None
+        self._last_drawn_scene = None
+        self.transition = None
+        
+        # Adaptive loop state
+        self._waited_event = None
+        self._last_interaction = -INTERACTIVE_HOLD_MS
         
         # Game state
         self.current_period = 0
         self.game_state = "playing"  # playing/win/lose
         self.first_day = True  # Track if this is first day
         
-        # Show intro event before starting game
+        # 先在加载界面后台解码所有场景资源，之后切换场景不再读盘
+        self.current_scene = self.loading_scene
+        self.loading_scene.start(asset_loader.preload_assets_async(self._asset_manifest()),
+                                 self._on_assets_loaded)
+    
+    def _asset_manifest(self):
+        """
+        Startup assets: data/assets.json "preload" plus every image the scenes draw
+        Each scene image is attributed to its scene in the asset report
+        """
+        manifest = data_loader.get("assets", "preload", default={})
+        images = set(manifest.get("images", [])) | set(BACKGROUND_IMAGES)
+        scenes = {}
+        for scene in (self.main_scene, self.shopping_scene, self.kitchen_scene):
+            for path in scene.preload_paths():
+                scenes.setdefault(path, type(scene).__name__)
+        images.update(scenes)
+        return {"images": sorted(images), "sounds": manifest.get("sounds", []),
+                "fonts": manifest.get("fonts", []), "scenes": scenes}
+    
+    def _on_assets_loaded(self):
+        """Leave the loading screen and show intro event before starting game"""
+        self.current_scene = self.main_scene
         self.show_intro_event()
+        self._schedule_background_warmup()
     
     def show_intro_event(self):
         """Show intro event on first day"""
@@ -72,6 +115,7 @@ class Game:
     def start_new_day(self, data=None):
         """Start new day"""
         self.current_period = 0
+        self._update_lighting()
         
         # Check expired items
         expired = self.player.check_expired_items()
@@ -139,7 +183,7 @@ class Game:
         self.player.decay_satiety()
         
         # Switch to kitchen scene
-        self.current_scene = self.kitchen_scene
+        self.set_scene(self.kitchen_scene, "slide_left")
     
     def process_night(self, data=None):
         """Process evening period"""
@@ -206,7 +250,7 @@ class Game:
     def go_shopping(self, location):
         """Go shopping"""
         self.shopping_scene.set_location(location)
-        self.current_scene = self.shopping_scene
+        self.set_scene(self.shopping_scene, "slide_left")
     
     def show_event(self, event, prefix_text=""):
         """Show event"""
@@ -317,6 +361,7 @@ class Game:
             return
         
         period_name = TIME_PERIODS[self.current_period]
+        self._update_lighting()
         
         if period_name == "Morning":
             self.process_morning()
@@ -329,6 +374,21 @@ class Game:
         elif period_name == "Evening":
             self.process_night()
     
+    def _schedule_background_warmup(self):
+        """Prepare every background at the current size and lighting in idle time"""
+        idle_scheduler.cancel("backgrounds")
+        idle_scheduler.schedule(prewarm_backgrounds(*self.screen.get_size()), priority=1, tag="backgrounds")
+    
+    def _update_lighting(self):
+        """Switch background colour grading to the current period"""
+        if not TIME_PERIODS or not lighting.set_period(TIME_PERIODS[self.current_period]):
+            return
+        # 主场景背景是静态烘焙层，需要重建
+        self.main_scene.compositor.invalidate("background")
+        for scene in (self.main_scene, self.shopping_scene, self.kitchen_scene):
+            scene.mark_all_dirty()
+        self._schedule_background_warmup()
+    
     def game_over(self, win):
         """Game over"""
         self.game_state = "win" if win else "lose"
@@ -350,9 +410,32 @@ class Game:
     
     def handle_events(self):
         """Handle events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        events = pygame.event.get()
+        if self._waited_event is not None:
+            # 空闲等待时取出的事件排在最前
+            events.insert(0, self._waited_event)
+            self._waited_event = None
+        
+        for event in self.input.coalesce(events):
+            event = self.renderer.to_framebuffer(event)
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.running = False
+            elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self.on_window_resized()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # 窗口被遮挡或最小化后恢复: 窗口内容已失效，需要整屏重绘
+                self.current_scene.mark_all_dirty()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                print(asset_loader.report(self.asset_report or "table"))
+            
+            if not self.input.dispatch(event, self.current_scene):
+                # 指针移动只更新悬停状态，不再分发给场景
+                if self.input.hovered:
+                    self._last_interaction = pygame.time.get_ticks()
+                continue
+            if self.transition is not None:
+                # 过渡动画期间不响应场景输入
+                continue
             
             # Scene event handling
             result = self.current_scene.handle_event(event)
@@ -390,34 +473,145 @@ class Game:
                         self.show_message(f"Cannot cook: {reason}", 
                                         [{"text": "Back", "callback": self.process_cooking}])
     
+    def on_window_resized(self):
+        """Handle window size change"""
+        if not self.renderer.on_window_resized():
+            # 绘制目标尺寸未变，只需重绘
+            self.current_scene.mark_all_dirty()
+            return
+        size = self.screen.get_size()
+        # 窗口尺寸变化时让缩放缓存失效
+        asset_loader.set_window_size(size)
+        for scene in (self.main_scene, self.shopping_scene, self.kitchen_scene, self.story_scene):
+            scene.on_resize(size)
+            scene.mark_all_dirty()
+            scene.invalidate_layout()
+        self._schedule_background_warmup()
+    
     def update(self):
         """Update game"""
+        # 当前场景用到的资源不会被缓存淘汰
+        asset_loader.set_pinned(self.current_scene.asset_paths())
+        asset_loader.set_context(self.renderer.frame_time.frames, type(self.current_scene).__name__)
+        # 后台解码完成的资源在主线程转换为显示格式
+        asset_loader.finish_loads()
         self.current_scene.update()
     
     def draw(self):
         """Draw game"""
-        self.current_scene.draw(self.screen)
-        pygame.display.flip()
+        if self.transition is not None:
+            self._draw_transition()
+            return
+        if DIRTY_RECTS and self.renderer.supports_dirty_rects:
+            self._draw_dirty()
+            return
+        self.current_scene.draw(self.renderer.begin_frame())
+        self.renderer.present()
+    
+    def _draw_transition(self):
+        """Blit the transition snapshots; live scenes are not redrawn meanwhile"""
+        self.transition.draw(self.renderer.begin_frame())
+        self.renderer.present()
+        if self.transition.done:
+            self.transition = None
+            self.current_scene.mark_all_dirty()
+    
+    def _draw_dirty(self):
+        """Redraw and push only the regions the scene reports as changed"""
+        scene = self.current_scene
+        if scene is not self._last_drawn_scene:
+            scene.mark_all_dirty()
+            self._last_drawn_scene = scene
+        
+        rects = scene.get_dirty_rects()
+        if rects is None:
+            scene.draw(self.renderer.begin_frame())
+            self.renderer.present()
+            return
+        if not rects:
+            return
+        
+        # 每个(合并后的)脏区域单独裁剪重绘，相距很远的区域不会连带重绘中间部分
+        rects = merge_rects(rects)
+        screen = self.renderer.begin_frame()
+        for rect in rects:
+            screen.set_clip(rect)
+            scene.draw(screen)
+        screen.set_clip(None)
+        self.renderer.present(rects)
     
     def play_story(self, pages, on_finish=None):
         """Play story"""
         self.previous_scene = self.current_scene
         self.story_scene.set_story(pages, on_finish)
-        self.current_scene = self.story_scene
-        
+        self.set_scene(self.story_scene, "fade")
+    
     def return_from_story(self):
         """Return from story scene"""
         if self.previous_scene:
-            self.current_scene = self.previous_scene
+            self.set_scene(self.previous_scene, "fade")
             self.previous_scene = None
     
+    def set_scene(self, scene, transition=None):
+        """
+        Switch the current scene
+        transition: "fade", "slide_left", "slide_right" or None for a cut
+        """
+        self.transition = None
+        # 还没有显示过任何帧时 (开场故事) 直接切换
+        if (transition and TRANSITION_MS > 0 and scene is not self.current_scene
+                and self.renderer.frame_time.frames > 0):
+            size = self.screen.get_size()
+            old_surface = snapshot_scene(self.current_scene, size)
+            scene.update()
+            new_surface = snapshot_scene(scene, size)
+            self.transition = Transition(old_surface, new_surface, TRANSITION_MS, transition)
+        self.current_scene = scene
+    
+    def is_animating(self):
+        """Whether something on screen is animating"""
+        return self.transition is not None or self.current_scene.is_animating()
+    
+    def is_interacting(self):
+        """Whether the mouse recently moved over an interactive widget"""
+        return pygame.time.get_ticks() - self._last_interaction < INTERACTIVE_HOLD_MS
+    
+    def _wait_for_event(self):
+        """Block until an event arrives or the idle frame interval elapses"""
+        event = pygame.event.wait(max(1, 1000 // IDLE_FPS))
+        if event.type != pygame.NOEVENT:
+            self._waited_event = event
+    
+    def _target_fps(self):
+        """Frame rate cap for the current loop state"""
+        if LOOP_MODE != "adaptive":
+            return FPS
+        if self.is_animating():
+            return ANIMATION_FPS
+        return INTERACTIVE_FPS
+    
     def run(self):
         """Run game main loop"""
         while self.running:
+            if LOOP_MODE == "adaptive" and not (self.is_animating() or self.is_interacting()
+                                                or idle_scheduler.pending):
+                self._wait_for_event()
+            frame_start = time.perf_counter()
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
-        
+            
+            # 本帧预算剩余的时间留给空闲任务
+            fps = self._target_fps()
+            elapsed_ms = (time.perf_counter() - frame_start) * 1000
+            idle_scheduler.run(1000 / fps - elapsed_ms - IDLE_MARGIN_MS)
+            self.clock.tick(fps)
+        
+        if LOG_FRAME_TIME:
+            frame_time = self.renderer.frame_time
+            print(f"Renderer '{self.renderer.name}': {frame_time.average_ms:.2f} ms/frame "
+                  f"over {frame_time.frames} frames")
+        if self.asset_report:
+            print(asset_loader.report(self.asset_report))
         pygame.quit()
         sys.exit()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Input dispatcher
+Filters and coalesces pygame events, resolves pointer hits through a
+spatial grid index and delivers hover enter/leave to affected widgets only
+"""
+
+import pygame
+
+from .config import *
+
+# 游戏实际处理的事件类型，其余在SDL队列中直接丢弃
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.WINDOWCLOSE,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWSIZECHANGED,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+]
+
+
+class HitGrid:
+    """Uniform grid over the screen mapping cells to the widgets that overlap them"""
+    
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._cells = {}  # (col, row) -> [widget]
+    
+    def rebuild(self, widgets):
+        """Re-index widget rects"""
+        size = self.cell_size
+        self._cells = {}
+        for widget in widgets:
+            rect = widget.rect
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            for col in range(rect.left // size, (rect.right - 1) // size + 1):
+                for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    self._cells.setdefault((col, row), []).append(widget)
+    
+    def query(self, pos):
+        """Widgets whose rect contains pos"""
+        candidates = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size), ())
+        return [widget for widget in candidates if widget.rect.collidepoint(pos)]
+
+
+class InputDispatcher:
+    """Pre-processes events before they reach the current scene
+    
+    Pointer motion is consumed here: the hover state of interactive widgets
+    (Widget.interactive) is resolved through a HitGrid, which is rebuilt
+    only when the scene changes or bumps its layout_version.
+    """
+    
+    def __init__(self, cell_size=HIT_GRID_CELL):
+        self.index = HitGrid(cell_size)
+        self.mouse_pos = (-1, -1)
+        self.hovered = []
+        self._scene = None
+        self._layout_version = None
+    
+    def install(self):
+        """Restrict the SDL event queue to the event types the game handles"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+    
+    @staticmethod
+    def coalesce(events):
+        """Merge runs of consecutive MOUSEMOTION events into the last one"""
+        result = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION and result and result[-1].type == pygame.MOUSEMOTION:
+                # 合并位移，保留最后的位置
+                previous = result[-1]
+                event.rel = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+                result[-1] = event
+            else:
+                result.append(event)
+        return result
+    
+    def _sync(self, scene):
+        """Rebuild the hit index after a scene switch or layout change"""
+        if scene is self._scene and scene.layout_version == self._layout_version:
+            return
+        if scene is not self._scene:
+            for widget in self.hovered:
+                widget.set_hovered(False)
+            self.hovered = []
+        self._scene = scene
+        self._layout_version = scene.layout_version
+        self.index.rebuild([widget for widget in scene.widgets() if widget.interactive])
+        self._update_hover(self.mouse_pos)
+    
+    def _update_hover(self, pos):
+        """Send hover leave/enter to widgets whose hover state changed"""
+        hits = self.index.query(pos)
+        for widget in self.hovered:
+            if widget not in hits:
+                widget.set_hovered(False)
+        for widget in hits:
+            if widget not in self.hovered:
+                widget.set_hovered(True)
+        self.hovered = hits
+    
+    def dispatch(self, event, scene):
+        """
+        Process pointer state for an event
+        Returns True if the event should still be passed to scene.handle_event
+        """
+        self._sync(scene)
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            self._update_hover(event.pos)
+            return False
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # 点击前未移动鼠标时也要命中正确的组件
+            self.mouse_pos = event.pos
+            self._update_hover(event.pos)
+        elif event.type == pygame.MOUSEWHEEL:
+            event.pos = self.mouse_pos
+        return True
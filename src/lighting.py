@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Period lighting
+Colour grades backgrounds per time period; the tinted variant for the
+active period is computed once and cached, so drawing it is still a
+single plain blit
+"""
+
+import weakref
+
+import pygame
+
+from .config import *
+
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
+
+class Lighting:
+    """Per-period colour grading of background surfaces
+    
+    A grade is {"multiply": [r, g, b], "add": [r, g, b]}: each channel is
+    scaled by multiply / 255, then offset by add. With NumPy the grade is
+    applied through per-channel lookup tables; without it the same result
+    comes from BLEND_RGB_MULT / BLEND_RGB_ADD fills.
+    """
+    
+    def __init__(self, grades):
+        self.grades = grades  # period name -> grade
+        self.period = None
+        # 只保留当前时段的调色副本，切换时段时释放
+        self._variants = weakref.WeakKeyDictionary()  # Surface -> graded Surface
+        self._luts = {}  # period -> [lut_r, lut_g, lut_b]
+    
+    def set_period(self, period):
+        """
+        Select the active period
+        Returns True if the lighting changed (cached variants are dropped)
+        """
+        if self.grades.get(period) == self.grades.get(self.period):
+            self.period = period
+            return False
+        self.period = period
+        self._variants = weakref.WeakKeyDictionary()
+        return True
+    
+    def _lut(self, period):
+        """Per-channel 256-entry lookup tables for a period"""
+        luts = self._luts.get(period)
+        if luts is None:
+            grade = self.grades[period]
+            multiply = grade.get("multiply", (255, 255, 255))
+            add = grade.get("add", (0, 0, 0))
+            values = numpy.arange(256, dtype=numpy.int32)
+            luts = [numpy.clip(values * multiply[c] // 255 + add[c], 0, 255).astype(numpy.uint8)
+                    for c in range(3)]
+            self._luts[period] = luts
+        return luts
+    
+    def _tint(self, surface, period):
+        """Build the graded copy of a surface"""
+        grade = self.grades[period]
+        if surface.get_colorkey() is not None:
+            # colorkey颜色也会被调色，改用逐像素alpha
+            tinted = surface.convert_alpha()
+        else:
+            tinted = surface.copy()
+        if numpy is not None and tinted.get_bitsize() in (24, 32):
+            pixels = pygame.surfarray.pixels3d(tinted)
+            for channel, lut in enumerate(self._lut(period)):
+                pixels[..., channel] = lut[pixels[..., channel]]
+            del pixels  # 释放表面锁
+        else:
+            # 没有NumPy时用混合填充实现同样的乘加
+            tinted.fill(grade.get("multiply", (255, 255, 255)), special_flags=pygame.BLEND_RGB_MULT)
+            tinted.fill(grade.get("add", (0, 0, 0)), special_flags=pygame.BLEND_RGB_ADD)
+        return tinted
+    
+    def apply(self, surface):
+        """Return the variant of surface for the active period (surface itself if ungraded)"""
+        if self.grades.get(self.period) is None:
+            return surface
+        tinted = self._variants.get(surface)
+        if tinted is None:
+            tinted = self._variants[surface] = self._tint(surface, self.period)
+        return tinted
+
+
+# Global instance for easy access
+lighting = Lighting(PERIOD_LIGHTING)
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Render queue
+Collects blit commands during a frame and submits them with a single
+Surface.blits call
+"""
+
+
+class RenderQueue:
+    """Per-frame queue of (surface, dest, area) blit commands
+    
+    Exposes a blit() method compatible with pygame.Surface.blit, so
+    widgets and text helpers can draw into the queue unchanged.
+    """
+    
+    def __init__(self, sort_by_layer=True):
+        self.sort_by_layer = sort_by_layer
+        self._commands = []  # (layer, source, dest, area)
+    
+    def __len__(self):
+        return len(self._commands)
+    
+    def blit(self, source, dest, area=None, layer=0):
+        """Queue a blit; higher layers are drawn later"""
+        self._commands.append((layer, source, dest, area))
+    
+    def clear(self):
+        """Drop all queued commands"""
+        self._commands.clear()
+    
+    def flush(self, target):
+        """Submit all queued blits to the target surface in one call"""
+        if not self._commands:
+            return
+        if self.sort_by_layer:
+            # list.sort 是稳定排序，同层保持提交顺序
+            self._commands.sort(key=lambda command: command[0])
+        target.blits([(source, dest, area) for _, source, dest, area in self._commands],
+                     doreturn=False)
+        self._commands.clear()
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Rendering backends
+SurfaceRenderer composes frames with software Surface blits;
+TextureRenderer assembles frames from cached SDL2 textures
+"""
+
+import time
+import weakref
+
+import pygame
+
+from .config import *
+
+try:
+    from pygame._sdl2 import video
+except ImportError:
+    video = None
+
+
+class SurfaceRenderer:
+    """Software backend: scenes draw into the display surface
+    
+    With pixel_scale > 1 scenes draw into an internal framebuffer of the
+    configured window size, which is upscaled by an integer factor (nearest
+    neighbour) when presented. With use_scaled_flag SDL does the upscale
+    through pygame.SCALED instead.
+    """
+    
+    name = "surface"
+    supports_dirty_rects = True
+    
+    def __init__(self, size, pixel_scale=1, use_scaled_flag=False):
+        if use_scaled_flag:
+            self.window = pygame.display.set_mode(size, pygame.SCALED)
+            self.screen = self.window
+        elif pixel_scale > 1:
+            self.window = pygame.display.set_mode((size[0] * pixel_scale, size[1] * pixel_scale))
+            self.screen = pygame.Surface(size).convert()
+        else:
+            self.window = pygame.display.set_mode(size)
+            self.screen = self.window
+        pygame.display.set_caption(TITLE)
+        self.frame_time = FrameTimer()
+        self._update_present_transform()
+    
+    def _update_present_transform(self):
+        """Integer scale and letterbox offset of the framebuffer inside the window"""
+        window_w, window_h = self.window.get_size()
+        screen_w, screen_h = self.screen.get_size()
+        self._present_scale = max(1, min(window_w // screen_w, window_h // screen_h))
+        self._present_offset = ((window_w - screen_w * self._present_scale) // 2,
+                                (window_h - screen_h * self._present_scale) // 2)
+    
+    def on_window_resized(self):
+        """
+        Handle window size change
+        Returns True if the draw target changed size
+        """
+        if self.window is self.screen:
+            return True
+        # 内部帧缓冲尺寸固定，只需重新计算放大倍数
+        self._update_present_transform()
+        self.window.fill(BLACK)
+        return False
+    
+    def to_framebuffer(self, event):
+        """Map mouse positions from window to framebuffer coordinates"""
+        if self.window is self.screen:
+            return event
+        scale = self._present_scale
+        offset_x, offset_y = self._present_offset
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            event.pos = ((event.pos[0] - offset_x) // scale, (event.pos[1] - offset_y) // scale)
+        if event.type == pygame.MOUSEMOTION:
+            event.rel = (event.rel[0] // scale, event.rel[1] // scale)
+        return event
+    
+    def begin_frame(self):
+        """Start a frame and return the draw target"""
+        self.frame_time.start()
+        return self.screen
+    
+    def present(self, rects=None):
+        """Push the frame (or only the given rects) to the display"""
+        if self.window is self.screen:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+            self.frame_time.stop()
+            return
+        
+        # 整数倍最近邻放大到窗口
+        scale = self._present_scale
+        offset_x, offset_y = self._present_offset
+        screen_rect = self.screen.get_rect()
+        updated = []
+        for rect in (rects if rects is not None else [screen_rect]):
+            rect = rect.clip(screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            dest = pygame.Rect(offset_x + rect.x * scale, offset_y + rect.y * scale,
+                               rect.width * scale, rect.height * scale)
+            pygame.transform.scale(self.screen.subsurface(rect), dest.size, self.window.subsurface(dest))
+            updated.append(dest)
+        
+        if rects is None:
+            pygame.display.flip()
+        elif updated:
+            pygame.display.update(updated)
+        self.frame_time.stop()
+
+
+class TextureCanvas:
+    """Draw target for TextureRenderer
+    
+    Implements the subset of the pygame.Surface API scenes use (fill, blit,
+    blits, size queries). Each blit becomes a copy of a texture uploaded
+    once per source surface. Sources are treated as immutable: code that
+    redraws a surface in place must call invalidate() for it.
+    """
+    
+    def __init__(self, renderer, size):
+        self.renderer = renderer
+        self._size = tuple(size)
+        self._textures = weakref.WeakKeyDictionary()  # Surface -> Texture
+    
+    def get_size(self):
+        return self._size
+    
+    def get_width(self):
+        return self._size[0]
+    
+    def get_height(self):
+        return self._size[1]
+    
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self._size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+    
+    def set_clip(self, rect=None):
+        """Clipping is not used: texture frames are always fully recomposed"""
+        pass
+    
+    def get_clip(self):
+        return self.get_rect()
+    
+    def invalidate(self, surface):
+        """Drop the texture uploaded for a surface that changed in place"""
+        self._textures.pop(surface, None)
+    
+    def texture_for(self, surface):
+        """Texture for a surface, uploaded on first use"""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+    
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(pygame.Rect(rect))
+    
+    def blit(self, source, dest, area=None, special_flags=0):
+        texture = self.texture_for(source)
+        if area is not None:
+            area = pygame.Rect(area)
+        size = area.size if area is not None else source.get_size()
+        # 表面整体透明度 (set_alpha) 对应纹理的 alpha mod
+        alpha = source.get_alpha()
+        texture.alpha = 255 if alpha is None else alpha
+        # dest 可以是坐标或Rect，只取左上角
+        texture.draw(srcrect=area, dstrect=pygame.Rect((dest[0], dest[1]), size))
+    
+    def blits(self, blit_sequence, doreturn=True):
+        for item in blit_sequence:
+            self.blit(*item)
+
+
+class TextureRenderer:
+    """SDL2 texture backend built on pygame._sdl2.video
+    
+    Uses an accelerated renderer when available and falls back to SDL's
+    software renderer otherwise. A hidden 1x1 display mode is kept so
+    Surface.convert() still has a pixel format to target.
+    """
+    
+    name = "texture"
+    supports_dirty_rects = False
+    
+    def __init__(self, size, pixel_scale=1):
+        if video is None:
+            raise ImportError("pygame._sdl2.video is not available")
+        
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        self.window = video.Window(TITLE, size=(size[0] * pixel_scale, size[1] * pixel_scale))
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except (pygame.error, RuntimeError):
+            # 没有GPU时使用SDL软件渲染器
+            self.renderer = video.Renderer(self.window, accelerated=0)
+            self.accelerated = False
+        # 逻辑尺寸: SDL负责放大输出并换算鼠标坐标
+        self.renderer.logical_size = tuple(size)
+        self.screen = TextureCanvas(self.renderer, size)
+        self.frame_time = FrameTimer()
+    
+    def on_window_resized(self):
+        return False
+    
+    def to_framebuffer(self, event):
+        return event
+    
+    def begin_frame(self):
+        self.frame_time.start()
+        self.renderer.draw_color = pygame.Color(BLACK)
+        self.renderer.clear()
+        return self.screen
+    
+    def present(self, rects=None):
+        self.renderer.present()
+        self.frame_time.stop()
+
+
+class FrameTimer:
+    """Running average of frame composition time"""
+    
+    def __init__(self):
+        self.frames = 0
+        self.total = 0.0
+        self._started = None
+    
+    def start(self):
+        self._started = time.perf_counter()
+    
+    def stop(self):
+        if self._started is not None:
+            self.total += time.perf_counter() - self._started
+            self.frames += 1
+            self._started = None
+    
+    @property
+    def average_ms(self):
+        return self.total * 1000 / self.frames if self.frames else 0.0
+
+
+def merge_rects(rects):
+    """
+    Merge overlapping rects into their unions
+    Returns non-overlapping rects covering every input rect
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            # 合并后可能与更多矩形重叠，继续吸收
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def create_renderer(size):
+    """Create the backend selected by render.backend in config.json"""
+    if RENDER_BACKEND == "texture":
+        try:
+            return TextureRenderer(size, PIXEL_SCALE)
+        except (ImportError, pygame.error, RuntimeError) as e:
+            print(f"Warning: texture renderer unavailable ({e}), using surface renderer")
+    return SurfaceRenderer(size, PIXEL_SCALE, USE_SCALED_FLAG)
@@ -4,11 +4,17 @@ Scene system
 Contains regular scene, shopping scene, kitchen scene
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 from .config import *
 from .ui import *
 from .backgrounds import *
 from .asset_loader import AssetLoader
+from .compositor import LayerCompositor
+from .render_queue import RenderQueue
+from .text_cache import text_cache, get_font
 
 
 class Scene:
@@ -17,6 +23,44 @@ class Scene:
     def __init__(self, game):
         self.game = game
         self.player = game.player
+        self._full_redraw = True
+        self.layout_version = 0
+        # 每帧的批量绘制队列，draw结束时一次性提交
+        self.render_queue = RenderQueue()
+    
+    def widgets(self):
+        """Widgets whose changes are tracked by the dirty-rect renderer"""
+        return []
+    
+    def asset_paths(self):
+        """Image paths the scene draws; pinned in the asset cache while active"""
+        return []
+    
+    def preload_paths(self):
+        """Image paths the scene may draw in any state; loaded behind the loading screen"""
+        return self.asset_paths()
+    
+    def is_animating(self):
+        """Whether the scene needs frames at full rate regardless of input"""
+        return False
+    
+    def invalidate_layout(self):
+        """Signal that widgets were added, removed or moved (rebuilds the hit index)"""
+        self.layout_version += 1
+    
+    def mark_all_dirty(self):
+        """Request a full-screen redraw on the next frame"""
+        self._full_redraw = True
+    
+    def get_dirty_rects(self):
+        """
+        Collect regions changed since the last draw
+        Returns None when the whole screen must be redrawn
+        """
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+        return [widget.dirty_rect() for widget in self.widgets() if widget.is_dirty()]
     
     def handle_event(self, event):
         """Handle events"""
@@ -29,6 +73,10 @@ class Scene:
     def draw(self, surface):
         """Draw scene"""
         pass
+    
+    def on_resize(self, size):
+        """Called when the window size changes"""
+        pass
 
 
 class MainScene(Scene):
@@ -49,13 +97,21 @@ class MainScene(Scene):
                                   self.player.get_mood_text(), color=(147, 112, 219), icon_text="Mood")
         self.money_badge = InfoBadge(20 + icon_space, 28 + 33 * 4, 145, 28, "Money",  # 第5个位置
                                    f"${self.player.money}", color=(218, 165, 32), icon_text="$")
-                                   
+        
         # 对话框移到界面下方，增加高度以容纳更多文本
         self.text_box = TextBox(50, WINDOW_HEIGHT - 310, WINDOW_WIDTH - 100, 240, "", 
                               font_size=22, bg_color=(20, 20, 35, 230))
         self.buttons = []
         self.current_text = ""
         self.event_data = None
+        
+        # 图层合成: 背景和状态框只渲染一次，其余每帧绘制
+        self.background = draw_room_background
+        self.compositor = LayerCompositor((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.compositor.add_layer("background", self._draw_background, static=True)
+        self.compositor.add_layer("status_frame", self._draw_status_frame, static=True)
+        self.compositor.add_layer("hud", self._draw_hud)
+        self.compositor.add_layer("dialog", self._draw_dialog)
     
     def _create_status_bars(self):
         """Create status bars"""
@@ -90,6 +146,9 @@ class MainScene(Scene):
         self.current_text = text
         self.text_box.set_text(text)
         self.event_data = event_data
+        # 按钮和日期可能变化，整屏重绘
+        self.mark_all_dirty()
+        self.invalidate_layout()
         
         # Create buttons - 按钮放在对话框上方
         self.buttons = []
@@ -129,17 +188,40 @@ class MainScene(Scene):
         self.mood_badge.update(self.player.get_mood_text())
         self.money_badge.update(f"${self.player.money}")
     
-    def draw(self, surface):
-        """Draw scene"""
+    def widgets(self):
+        widgets = [bar for bar in self.status_bars if bar]
+        widgets += [self.mood_badge, self.money_badge, self.text_box]
+        return widgets + self.buttons
+    
+    def asset_paths(self):
+        paths = ["ui/uiStatus.png"]
+        if hasattr(self.background, "image_path"):
+            paths.append(self.background.image_path)
+        return paths
+    
+    def set_background(self, draw_func):
+        """Swap the background drawing function"""
+        self.background = draw_func
+        self.compositor.invalidate("background")
+        self.mark_all_dirty()
+    
+    def on_resize(self, size):
+        """Rebuild static layers for the new window size"""
+        self.compositor.resize(size)
+    
+    def _draw_background(self, surface):
+        """Static layer: full-screen pixel background"""
         surface.fill(WHITE)
-        
-        # 绘制全屏像素背景
-        draw_room_background(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
-        
-        # 绘制UI状态背景原图（保持比例，放在左上角）
+        width, height = surface.get_size()
+        self.background(surface, 0, 0, width, height)
+    
+    def _draw_status_frame(self, surface):
+        """Static layer: status panel frame (保持比例，放在左上角)"""
         if self.ui_status_bg:
             surface.blit(self.ui_status_bg, (20, 20))
-        
+    
+    def _draw_hud(self, surface):
+        """Dynamic layer: status bars, badges and day counter"""
         # Draw status bars (左上角垂直排布)
         for bar in self.status_bars:
             if bar:  # 跳过None（心情位置用InfoBadge显示）
@@ -151,14 +233,21 @@ class MainScene(Scene):
         
         # Draw day counter (右上角)
         day_text = f"Day {self.player.current_day}/{GAME_DAYS}"
-        draw_text(surface, day_text, WINDOW_WIDTH - 150, 20, 28, RED)
-        
+        draw_glyph_text(surface, day_text, WINDOW_WIDTH - 150, 20, 28, RED)
+    
+    def _draw_dialog(self, surface):
+        """Dynamic layer: text box and buttons"""
         # Draw text box (界面下方)
         self.text_box.draw(surface)
         
         # Draw buttons (对话框上方)
         for button in self.buttons:
             button.draw(surface)
+    
+    def draw(self, surface):
+        """Draw scene"""
+        self.compositor.draw(self.render_queue)
+        self.render_queue.flush(surface)
 
 
 class ShoppingScene(Scene):
@@ -167,21 +256,45 @@ class ShoppingScene(Scene):
     def __init__(self, game):
         super().__init__(game)
         self.location = "Market"
-        self.item_slots = []
         self.back_button = Button(50, WINDOW_HEIGHT - 100, 150, 50, "Back", font_size=28)
         self.buy_button = Button(WINDOW_WIDTH - 200, WINDOW_HEIGHT - 100, 150, 50, 
                                  "Buy", font_size=28, color=GREEN)
         self.selected_items = {}
+        
+        # 商品网格 (只为可见行创建槽位)
+        self.item_grid = VirtualGrid(50, 120, 874, WINDOW_HEIGHT - 320,
+                                     200, 60, 4, 20, 10,
+                                     lambda x, y, w, h: ItemSlot(x, y, w, h, "", 0),
+                                     self._bind_item_slot)
     
     def set_location(self, location):
         """Set shopping location"""
         self.location = location
         self.selected_items = {}
-        self._create_item_slots()
+        self.item_grid.set_items(self._get_available_items())
+        self.mark_all_dirty()
+        self.invalidate_layout()
+    
+    def widgets(self):
+        return self.item_grid.slots() + [self.back_button, self.buy_button]
+    
+    def asset_paths(self):
+        return [self._background().image_path]
+    
+    def preload_paths(self):
+        return [draw.image_path for draw in (draw_market_background, draw_convenience_store_background,
+                                             draw_restaurant_background)]
     
-    def _create_item_slots(self):
-        """Create item slots"""
-        self.item_slots = []
+    def _background(self):
+        """Background drawing function for the current location"""
+        if self.location == "Convenience Store":
+            return draw_convenience_store_background
+        elif self.location == "Restaurant":
+            return draw_restaurant_background
+        return draw_market_background
+    
+    def _get_available_items(self):
+        """Items sold at the current location"""
         available_items = []
         
         ingredients = get_ingredients()
@@ -197,26 +310,15 @@ class ShoppingScene(Scene):
                 if data.get("location") == self.location:
                     available_items.append((name, data))
         
-        # Create item slots
-        slot_width = 200
-        slot_height = 60
-        x_start = 50
-        y_start = 120
-        cols = 4
-        x_spacing = 20
-        y_spacing = 10
-        
-        for i, (name, data) in enumerate(available_items):
-            row = i // cols
-            col = i % cols
-            x = x_start + col * (slot_width + x_spacing)
-            y = y_start + row * (slot_height + y_spacing)
-            
-            price_text = f"{name} (${data.get('price', 0)})"
-            slot = ItemSlot(x, y, slot_width, slot_height, price_text, 0)
-            slot.item_name = name
-            slot.price = data.get("price", 0)
-            self.item_slots.append(slot)
+        return available_items
+    
+    def _bind_item_slot(self, slot, item):
+        """Show an item in a recycled slot; selection comes from selected_items"""
+        name, data = item
+        slot.item_name = name
+        slot.price = data.get("price", 0)
+        slot.count = self.selected_items.get(name, 0)
+        slot.is_selected = slot.count > 0
     
     def handle_event(self, event):
         """Handle events"""
@@ -226,24 +328,25 @@ class ShoppingScene(Scene):
         if self.buy_button.handle_event(event):
             return self._process_purchase()
         
-        # Handle item selection
-        for slot in self.item_slots:
-            if slot.handle_event(event):
-                # Left click adds item
-                if event.button == 1:
-                    item_name = slot.item_name
-                    self.selected_items[item_name] = self.selected_items.get(item_name, 0) + 1
-                    slot.count = self.selected_items[item_name]
-                    slot.is_selected = True
-                # Right click removes item
-                elif event.button == 3:
-                    item_name = slot.item_name
-                    if item_name in self.selected_items and self.selected_items[item_name] > 0:
-                        self.selected_items[item_name] -= 1
-                        if self.selected_items[item_name] == 0:
-                            del self.selected_items[item_name]
-                            slot.is_selected = False
-                        slot.count = self.selected_items.get(item_name, 0)
+        # Handle item selection and scrolling
+        result = self.item_grid.handle_event(event)
+        if result == "scrolled":
+            self.mark_all_dirty()
+            self.invalidate_layout()
+        elif result is not None:
+            item_name = result[0]
+            # Left click adds item
+            if event.button == 1:
+                self.selected_items[item_name] = self.selected_items.get(item_name, 0) + 1
+            # Right click removes item
+            elif event.button == 3:
+                if item_name in self.selected_items and self.selected_items[item_name] > 0:
+                    self.selected_items[item_name] -= 1
+                    if self.selected_items[item_name] == 0:
+                        del self.selected_items[item_name]
+            self.item_grid.refresh()
+            # 总价文字不属于组件，整屏重绘
+            self.mark_all_dirty()
         
         return None
     
@@ -293,24 +396,20 @@ class ShoppingScene(Scene):
         surface.fill(WHITE)
         
         # Draw background based on location
-        if self.location == "Convenience Store":
-            draw_convenience_store_background(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
-        elif self.location == "Restaurant":
-            draw_restaurant_background(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
-        else:
-            draw_market_background(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self._background()(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+        
+        queue = self.render_queue
         
         # Title
         title = f"{self.location}"
-        draw_text(surface, title, WINDOW_WIDTH // 2, 30, 36, BLACK, center=True)
+        draw_text(queue, title, WINDOW_WIDTH // 2, 30, 36, BLACK, center=True)
         
         # Money display
         money_text = f"Money: ${self.player.money}"
-        draw_text(surface, money_text, WINDOW_WIDTH // 2, 70, 28, GREEN, center=True)
+        draw_glyph_text(queue, money_text, WINDOW_WIDTH // 2, 70, 28, GREEN, center=True)
         
         # Draw item slots
-        for slot in self.item_slots:
-            slot.draw(surface)
+        self.item_grid.draw(queue)
         
         # Draw total cost
         ingredients = get_ingredients()
@@ -326,15 +425,16 @@ class ShoppingScene(Scene):
         if total_cost > 0:
             cost_text = f"Total: ${total_cost}"
             color = RED if total_cost > self.player.money else BLACK
-            draw_text(surface, cost_text, WINDOW_WIDTH // 2, WINDOW_HEIGHT - 150, 32, color, center=True)
+            draw_glyph_text(queue, cost_text, WINDOW_WIDTH // 2, WINDOW_HEIGHT - 150, 32, color, center=True)
         
         # Hint
         hint_text = "Left click to select, Right click to cancel"
-        draw_text(surface, hint_text, WINDOW_WIDTH // 2, WINDOW_HEIGHT - 180, 20, GRAY, center=True)
+        draw_text(queue, hint_text, WINDOW_WIDTH // 2, WINDOW_HEIGHT - 180, 20, GRAY, center=True)
         
         # Draw buttons
-        self.back_button.draw(surface)
-        self.buy_button.draw(surface)
+        self.back_button.draw(queue)
+        self.buy_button.draw(queue)
+        queue.flush(surface)
 
 
 class KitchenScene(Scene):
@@ -342,34 +442,31 @@ class KitchenScene(Scene):
     
     def __init__(self, game):
         super().__init__(game)
-        self.recipe_buttons = []
         self.back_button = Button(WINDOW_WIDTH // 2 - 75, WINDOW_HEIGHT - 100, 150, 50, 
                                   "Finish Cooking", font_size=28, color=RED)
-        self._create_recipe_buttons()
-    
-    def _create_recipe_buttons(self):
-        """Create recipe buttons"""
-        self.recipe_buttons = []
-        recipes = get_recipes()
-        
-        button_width = 220
-        button_height = 80
-        x_start = 50
-        y_start = 150
-        cols = 3
-        x_spacing = 30
-        y_spacing = 20
-        
-        for i, (name, data) in enumerate(recipes.items()):
-            row = i // cols
-            col = i % cols
-            x = x_start + col * (button_width + x_spacing)
-            y = y_start + row * (button_height + y_spacing)
-            
-            button = Button(x, y, button_width, button_height, name, font_size=22)
-            button.recipe_name = name
-            button.recipe_data = data
-            self.recipe_buttons.append(button)
+        
+        # 菜谱网格 (只为可见行创建按钮)
+        self.recipe_grid = VirtualGrid(50, 150, 734, 340,
+                                       220, 80, 3, 30, 20,
+                                       lambda x, y, w, h: Button(x, y, w, h, "", font_size=22),
+                                       self._bind_recipe_button)
+        self.recipe_grid.set_items(get_recipes().items())
+    
+    def widgets(self):
+        return self.recipe_grid.slots() + [self.back_button]
+    
+    def asset_paths(self):
+        return [draw_kitchen_background.image_path]
+    
+    def _bind_recipe_button(self, button, item):
+        """Show a recipe in a recycled button"""
+        name, data = item
+        button.text = name
+        button.recipe_name = name
+        button.recipe_data = data
+        # Check if can cook
+        can_cook, reason = self._can_cook(data)
+        button.color = GREEN if can_cook else GRAY
     
     def _can_cook(self, recipe_data):
         """Check if can cook this recipe"""
@@ -411,13 +508,19 @@ class KitchenScene(Scene):
         if self.back_button.handle_event(event):
             return "back"
         
-        for button in self.recipe_buttons:
-            if button.handle_event(event):
-                result = self._cook_recipe(button.recipe_name, button.recipe_data)
-                return result
+        result = self.recipe_grid.handle_event(event)
+        if result == "scrolled":
+            self.mark_all_dirty()
+            self.invalidate_layout()
+        elif result is not None:
+            return self._cook_recipe(*result)
         
         return None
     
+    def update(self):
+        """Update recipe availability colors"""
+        self.recipe_grid.refresh()
+    
     def draw(self, surface):
         """Draw scene"""
         surface.fill(WHITE)
@@ -425,88 +528,202 @@ class KitchenScene(Scene):
         # Draw background
         draw_kitchen_background(surface, 0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
         
+        queue = self.render_queue
+        
         # Title
-        draw_text(surface, "Kitchen - Choose Recipe", WINDOW_WIDTH // 2, 30, 36, BLACK, center=True)
+        draw_text(queue, "Kitchen - Choose Recipe", WINDOW_WIDTH // 2, 30, 36, BLACK, center=True)
         
         # Show current status
         status_text = f"Stamina: {int(self.player.stamina)}/{STAT_MAX}  Satiety: {int(self.player.satiety)}/{STAT_MAX}"
-        draw_text(surface, status_text, WINDOW_WIDTH // 2, 80, 24, BLACK, center=True)
+        draw_glyph_text(queue, status_text, WINDOW_WIDTH // 2, 80, 24, BLACK, center=True)
         
         # Draw recipe buttons
-        for button in self.recipe_buttons:
-            # Check if can cook
-            can_cook, reason = self._can_cook(button.recipe_data)
-            if not can_cook:
-                button.color = GRAY
-            else:
-                button.color = GREEN
-            
-            button.draw(surface)
-            
+        self.recipe_grid.draw(queue)
+        for button in self.recipe_grid.slots():
             # Show ingredient requirements
             ingredients_text = ", ".join([f"{k}x{v}" for k, v in button.recipe_data.get("ingredients", {}).items()])
-            draw_text(surface, ingredients_text, button.rect.centerx, button.rect.bottom + 5, 
+            draw_text(queue, ingredients_text, button.rect.centerx, button.rect.bottom + 5, 
                      16, GRAY, center=True)
         
         # Show inventory
         inventory_y = 500
-        draw_text(surface, "Current Inventory:", 50, inventory_y, 24, BLACK)
+        draw_text(queue, "Current Inventory:", 50, inventory_y, 24, BLACK)
         inventory_text = ", ".join([f"{k}x{v['count']}" for k, v in self.player.inventory.items()])
         if not inventory_text:
             inventory_text = "None"
-        draw_text(surface, inventory_text, 50, inventory_y + 30, 20, GRAY)
+        draw_text(queue, inventory_text, 50, inventory_y + 30, 20, GRAY)
         
         # Draw back button
-        self.back_button.draw(surface)
+        self.back_button.draw(queue)
+        queue.flush(surface)
+
 
 class StoryScene(Scene):
     """Story playback scene"""
     
+    TEXT_X = 100
+    TEXT_Y = 200
+    FONT_SIZE = 32
+    
+    # 后台线程预渲染故事页面，每个线程持有自己的字体实例
+    _executor = None
+    _worker_fonts = threading.local()
+    
     def __init__(self, game):
         super().__init__(game)
         self.pages = []
         self.current_page_index = 0
         self.on_finish_callback = None
-        self.font = pygame.font.Font(None, 32)
-        self.instruction_font = pygame.font.Font(None, 24)
-        
+        self.font = get_font(self.FONT_SIZE)
+        self.instruction_font = get_font(24)
+        self._page_surfaces = {}  # page index -> Surface or Future
+    
     def set_story(self, pages, on_finish_callback=None):
-        """Set story content"""
+        """Set story content and start pre-rendering pages"""
         self.pages = pages
         self.current_page_index = 0
         self.on_finish_callback = on_finish_callback
-        
+        self._page_surfaces = {}
+        self._prefetch_pages()
+        self.mark_all_dirty()
+    
+    @classmethod
+    def _render_page_in_worker(cls, text, width):
+        """Worker-thread page render with a thread-owned font"""
+        font = getattr(cls._worker_fonts, "font", None)
+        if font is None:
+            font = cls._worker_fonts.font = pygame.font.Font(None, cls.FONT_SIZE)
+        return render_text_block(text, font, width, WHITE)
+    
+    def _prefetch_pages(self):
+        """Queue the next STORY_PREFETCH_PAGES pages and drop pages already shown"""
+        for index in list(self._page_surfaces):
+            if index < self.current_page_index:
+                del self._page_surfaces[index]
+        
+        if StoryScene._executor is None:
+            StoryScene._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="story-prefetch")
+        
+        width = WINDOW_WIDTH - self.TEXT_X * 2
+        end = min(len(self.pages), self.current_page_index + max(1, STORY_PREFETCH_PAGES))
+        for index in range(self.current_page_index, end):
+            if index not in self._page_surfaces:
+                self._page_surfaces[index] = StoryScene._executor.submit(
+                    self._render_page_in_worker, self.pages[index], width)
+    
+    def _get_page_surface(self, index):
+        """Pre-rendered page surface, rendered synchronously if the worker is behind"""
+        page = self._page_surfaces.get(index)
+        if isinstance(page, pygame.Surface):
+            return page
+        
+        if page is not None and page.done() and page.exception() is None:
+            surface = page.result().convert_alpha()
+        else:
+            if page is not None:
+                page.cancel()
+            width = WINDOW_WIDTH - self.TEXT_X * 2
+            surface = render_text_block(self.pages[index], self.font, width, WHITE).convert_alpha()
+        self._page_surfaces[index] = surface
+        return surface
+    
     def handle_event(self, event):
         """Handle events"""
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Left click to next page
             if event.button == 1:
                 self.current_page_index += 1
+                self.mark_all_dirty()
                 if self.current_page_index >= len(self.pages):
                     # Story finished
                     if self.on_finish_callback:
                         self.on_finish_callback()
                     self.game.return_from_story()
+                else:
+                    self._prefetch_pages()
                 return True
         return False
-        
+    
     def draw(self, surface):
         """Draw scene"""
         # Black background
         surface.fill(BLACK)
         
         if 0 <= self.current_page_index < len(self.pages):
-            text = self.pages[self.current_page_index]
-            
-            # Draw text centered
-            draw_multiline_text(surface, text, 100, 200, WINDOW_WIDTH - 200, 
-                              font_size=32, color=WHITE)
+            # Pre-rendered page text
+            surface.blit(self._get_page_surface(self.current_page_index), (self.TEXT_X, self.TEXT_Y))
             
             # Draw instruction
             instruction = "Click to continue..."
             if self.current_page_index == len(self.pages) - 1:
                 instruction = "Click to finish"
-                
-            text_surf = self.instruction_font.render(instruction, True, GRAY)
+            
+            text_surf = text_cache.render(instruction, 24, GRAY)
             text_rect = text_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
             surface.blit(text_surf, text_rect)
+
+
+class LoadingScene(Scene):
+    """Progress screen shown while a batch of assets loads in the background"""
+    
+    BAR_WIDTH = 480
+    BAR_HEIGHT = 16
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.handles = []
+        self.on_finish = None
+        self._shown_progress = None
+        self._bar = None  # (progress, Surface)
+    
+    def start(self, handles, on_finish=None):
+        """Track AssetHandles; on_finish is called once they are all done"""
+        self.handles = list(handles)
+        self.on_finish = on_finish
+        self._shown_progress = None
+        self.mark_all_dirty()
+    
+    @property
+    def progress(self):
+        """Fraction of handles done, 0.0 - 1.0"""
+        if not self.handles:
+            return 1.0
+        return sum(1 for handle in self.handles if handle.done()) / len(self.handles)
+    
+    def is_animating(self):
+        # 加载期间持续出帧，finish_loads 才能及时完成句柄
+        return self.on_finish is not None
+    
+    def update(self):
+        """Redraw on progress; leave once everything is loaded"""
+        progress = self.progress
+        if progress != self._shown_progress:
+            self._shown_progress = progress
+            self.mark_all_dirty()
+        if progress >= 1.0 and self.on_finish is not None:
+            callback, self.on_finish = self.on_finish, None
+            callback()
+    
+    def _bar_surface(self, progress):
+        """Progress bar surface, rebuilt (new Surface) only when progress changes"""
+        if self._bar is None or self._bar[0] != progress:
+            # 每次新建表面: 纹理后端按表面对象缓存纹理
+            bar = pygame.Surface((self.BAR_WIDTH, self.BAR_HEIGHT), pygame.SRCALPHA)
+            radius = self.BAR_HEIGHT // 2
+            pygame.draw.rect(bar, (60, 60, 60), bar.get_rect(), border_radius=radius)
+            if progress > 0:
+                filled = pygame.Rect(0, 0, max(self.BAR_HEIGHT, int(self.BAR_WIDTH * progress)), self.BAR_HEIGHT)
+                pygame.draw.rect(bar, LIGHT_GRAY, filled, border_radius=radius)
+            self._bar = (progress, bar)
+        return self._bar[1]
+    
+    def draw(self, surface):
+        """Draw scene"""
+        surface.fill(BLACK)
+        progress = self.progress
+        
+        text_surf = text_cache.render(f"Loading... {int(progress * 100)}%", 28, WHITE)
+        surface.blit(text_surf, text_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20)))
+        
+        bar = self._bar_surface(progress)
+        surface.blit(bar, bar.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20)))
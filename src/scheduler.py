@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Idle task scheduler
+Cooperative jobs that run in the time left over after each frame
+"""
+
+import heapq
+import itertools
+import time
+
+
+class Job:
+    """A queued unit of idle work
+    
+    work is either a callable, run once, or a generator, advanced one
+    step per slot so long tasks can be spread over many frames.
+    """
+    
+    def __init__(self, work, priority=0, tag=None):
+        self.work = work
+        self.priority = priority
+        self.tag = tag
+        self.cancelled = False
+        self.done = False
+    
+    def cancel(self):
+        """Drop the job; a running generator is closed"""
+        self.cancelled = True
+        if hasattr(self.work, "close"):
+            self.work.close()
+    
+    def step(self):
+        """
+        Run one step of the job
+        Returns True if the job has more work to do
+        """
+        try:
+            if hasattr(self.work, "__next__"):
+                next(self.work)
+                return True
+            self.work()
+        except StopIteration:
+            pass
+        except Exception as e:
+            print(f"Warning: idle job {self.tag or self.work} failed: {e}")
+        self.done = True
+        return False
+
+
+class IdleScheduler:
+    """Priority queue of jobs run within a time budget
+    
+    Lower priority values run first; jobs with equal priority run in the
+    order they were scheduled. A generator job keeps its place in the
+    queue between steps.
+    """
+    
+    def __init__(self):
+        self._queue = []  # (priority, seq, Job)
+        self._counter = itertools.count()
+    
+    def __len__(self):
+        return sum(1 for _, _, job in self._queue if not job.cancelled)
+    
+    @property
+    def pending(self):
+        """Whether any job is waiting to run"""
+        return any(not job.cancelled for _, _, job in self._queue)
+    
+    def schedule(self, work, priority=0, tag=None):
+        """Queue a callable or generator; returns the Job handle"""
+        job = Job(work, priority, tag)
+        heapq.heappush(self._queue, (priority, next(self._counter), job))
+        return job
+    
+    def cancel(self, tag):
+        """Cancel every queued job with the given tag"""
+        for _, _, job in self._queue:
+            if job.tag == tag:
+                job.cancel()
+    
+    def run(self, budget_ms):
+        """
+        Run jobs until budget_ms has elapsed or the queue is empty
+        Returns the number of steps executed
+        """
+        if budget_ms <= 0:
+            return 0
+        deadline = time.perf_counter() + budget_ms / 1000
+        steps = 0
+        while self._queue and time.perf_counter() < deadline:
+            priority, seq, job = self._queue[0]
+            if job.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            steps += 1
+            if not job.step():
+                heapq.heappop(self._queue)
+        return steps
+
+
+# Global instance for easy access
+idle_scheduler = IdleScheduler()
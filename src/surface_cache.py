@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Decoded surface cache
+Persists converted image pixels to disk so later launches rebuild them
+with pygame.image.frombuffer instead of inflating the PNG again
+"""
+
+import hashlib
+import json
+import os
+import struct
+
+import pygame
+
+MAGIC = b"GSKS"
+VERSION = 1
+HEADER = struct.Struct("<4sII")  # magic, version, meta length
+
+
+def display_format():
+    """Description of the display pixel format converted surfaces depend on"""
+    display = pygame.display.get_surface()
+    if display is None:
+        return None
+    return [display.get_bitsize(), list(display.get_masks())]
+
+
+class SurfaceCache:
+    """Directory of pre-decoded surfaces
+    
+    Each entry holds the pixels of a converted surface (tobytes) together
+    with the stamp of the source file, the display format it was converted
+    for and the format AssetLoader chose (opaque / colorkey / alpha). A
+    mismatch on any of them is a miss, and the entry is rewritten (pack()
+    then write()) after the image is decoded again.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+    
+    def _file(self, key):
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".surf")
+    
+    def read(self, key, stamp):
+        """
+        Read a cache entry without converting it (safe on a worker thread)
+        
+        Args:
+            key: Cache key (asset path and load options)
+            stamp: JSON-compatible identity of the source file (e.g. mtime and size)
+        
+        Returns:
+            (unconverted surface, meta) or None on a miss
+        """
+        if not self.enabled:
+            return None
+        try:
+            with open(self._file(key), "rb") as f:
+                data = f.read()
+            magic, version, meta_length = HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("stale cache entry")
+            meta = json.loads(data[HEADER.size:HEADER.size + meta_length].decode("utf-8"))
+        except (OSError, ValueError, struct.error):
+            self.misses += 1
+            return None
+        if meta.get("key") != key or meta.get("stamp") != stamp or meta.get("display") != display_format():
+            self.misses += 1
+            return None
+        
+        pixels = memoryview(data)[HEADER.size + meta_length:]
+        try:
+            surface = pygame.image.frombuffer(pixels, meta["size"], meta["buffer"])
+        except (ValueError, pygame.error):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return surface, meta
+    
+    def convert(self, surface, meta):
+        """Convert a surface from read() to the display format; returns (surface, image format name)"""
+        # 再转换为显示格式; 字节布局相同时只是一次拷贝，不需要解压PNG
+        if meta["buffer"] == "BGRA":
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        if meta.get("colorkey") is not None:
+            surface.set_colorkey(meta["colorkey"], pygame.RLEACCEL)
+        return surface, meta["format"]
+    
+    def pack(self, key, stamp, surface, image_format):
+        """
+        Serialize a converted surface into entry bytes
+        
+        Reads the surface pixels, so call it on the thread that owns the
+        surface (the main thread); the result can go to write() anywhere.
+        
+        Returns:
+            (meta bytes, pixel bytes) or None if the cache is disabled
+        """
+        if not self.enabled or display_format() is None:
+            return None
+        buffer = "BGRA" if surface.get_flags() & pygame.SRCALPHA else "RGBX"
+        colorkey = surface.get_colorkey()
+        meta = json.dumps({
+            "key": key,
+            "stamp": stamp,
+            "display": display_format(),
+            "format": image_format,
+            "buffer": buffer,
+            "size": list(surface.get_size()),
+            "colorkey": list(colorkey[:3]) if colorkey is not None else None,
+        }).encode("utf-8")
+        return meta, pygame.image.tobytes(surface, buffer)
+    
+    def write(self, key, entry):
+        """Write an entry from pack(); only file I/O, safe on a worker thread. Disables the cache if not writable"""
+        meta, pixels = entry
+        path = self._file(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(meta)))
+                f.write(meta)
+                f.write(pixels)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            # 打包安装目录可能只读，之后不再尝试
+            print(f"Warning: Surface cache disabled ({self.directory}): {e}")
+            self.enabled = False
+    
+    def clear(self):
+        """Delete every cache entry"""
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".surf"):
+                os.remove(os.path.join(self.directory, filename))
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Rendered text cache
+Shared font pool, bounded LRU cache of text surfaces used by all UI drawing
+code, and a glyph atlas for frequently changing HUD / number text
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from .config import TEXT_CACHE_SIZE
+from .asset_loader import asset_loader
+
+
+def get_font(font_size, font_path=None):
+    """
+    Get a shared font instance.
+    
+    All UI code obtains fonts here so each (path, size) is parsed once and
+    pooled by AssetLoader.load_font; widgets keep references, not copies.
+    """
+    return asset_loader.load_font(font_path, font_size)
+
+
+class TextCache:
+    """LRU cache keyed by (font, size, text, color, antialias)"""
+    
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, text, font_size, color, antialias=True, font_path=None):
+        """
+        Render text or return the cached surface.
+        
+        Args:
+            text: String to render
+            font_size: Font size in pixels
+            color: RGB(A) text color
+            antialias: Whether to antialias glyph edges
+            font_path: Relative path within assets/fonts/, None for the default font
+        
+        Returns:
+            pygame.Surface with the rendered text
+        """
+        key = (font_path, font_size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        font = get_font(font_size, font_path)
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Drop all cached surfaces and reset counters"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self):
+        """Cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class GlyphPage:
+    """Atlas surface holding the glyphs of one (font, size, color, antialias)
+    
+    Glyphs are packed left to right in rows of PAGE_WIDTH pixels. Adding
+    glyphs always produces a new atlas surface instead of drawing into the
+    current one, because the texture renderer caches uploads per surface.
+    """
+    
+    PAGE_WIDTH = 512
+    
+    def __init__(self, font, color, antialias):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.surface = pygame.Surface((self.PAGE_WIDTH, self.height), pygame.SRCALPHA)
+        self.glyphs = {}  # char -> Rect in the atlas
+        self._next_x = 0
+        self._next_y = 0
+    
+    def ensure(self, text):
+        """
+        Rasterize the characters of text that are not in the atlas yet
+        Returns the number of glyphs added
+        """
+        missing = [char for char in dict.fromkeys(text) if char not in self.glyphs]
+        if not missing:
+            return 0
+        
+        rendered = []
+        for char in missing:
+            glyph = self.font.render(char, self.antialias, self.color)
+            if self._next_x + glyph.get_width() > self.PAGE_WIDTH:
+                self._next_x = 0
+                self._next_y += self.height
+            rect = pygame.Rect(self._next_x, self._next_y, glyph.get_width(), self.height)
+            self._next_x += rect.width
+            rendered.append((char, glyph, rect))
+        
+        # 新建图集表面再拷贝旧内容 (MAX混合到全透明表面上即原样复制)
+        height = max(self.surface.get_height(), self._next_y + self.height)
+        surface = pygame.Surface((self.PAGE_WIDTH, height), pygame.SRCALPHA)
+        surface.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        for char, glyph, rect in rendered:
+            surface.blit(glyph, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[char] = rect
+        self.surface = surface
+        return len(rendered)
+
+
+class GlyphAtlas:
+    """Text renderer that lays strings out from cached glyphs
+    
+    Each (font, size, color, char) is rasterized once; drawing a string is
+    one blit per character from the atlas, so changing numbers never cause
+    a TTF render. Kerning is not applied, which suits HUD labels and numbers.
+    """
+    
+    def __init__(self):
+        self._pages = {}  # (font_path, font_size, color, antialias) -> GlyphPage
+        self.glyphs_rendered = 0
+    
+    def page(self, font_size, color, antialias=True, font_path=None):
+        """Glyph page for a font, size and color"""
+        key = (font_path, font_size, tuple(color), antialias)
+        page = self._pages.get(key)
+        if page is None:
+            page = GlyphPage(get_font(font_size, font_path), color, antialias)
+            self._pages[key] = page
+        return page
+    
+    def size(self, text, font_size, color, antialias=True, font_path=None):
+        """(width, height) of text laid out from glyphs"""
+        page = self.page(font_size, color, antialias, font_path)
+        self.glyphs_rendered += page.ensure(text)
+        return (sum(page.glyphs[char].width for char in text), page.height)
+    
+    def render_to(self, surface, text, dest, font_size, color, antialias=True, font_path=None):
+        """
+        Blit text glyph by glyph onto surface (a Surface or RenderQueue).
+        
+        Args:
+            surface: Draw target
+            text: String to draw
+            dest: Top-left position
+            font_size: Font size in pixels
+            color: RGB(A) text color
+            antialias: Whether to antialias glyph edges
+            font_path: Relative path within assets/fonts/, None for the default font
+        
+        Returns:
+            pygame.Rect covered by the text
+        """
+        page = self.page(font_size, color, antialias, font_path)
+        self.glyphs_rendered += page.ensure(text)
+        atlas = page.surface
+        x, y = dest[0], dest[1]
+        for char in text:
+            area = page.glyphs[char]
+            surface.blit(atlas, (x, y), area)
+            x += area.width
+        return pygame.Rect(dest[0], dest[1], x - dest[0], page.height)
+    
+    def clear(self):
+        """Drop all glyph pages"""
+        self._pages.clear()
+        self.glyphs_rendered = 0
+
+
+# Global instances for easy access
+text_cache = TextCache(TEXT_CACHE_SIZE)
+glyph_atlas = GlyphAtlas()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Scene transitions
+Fades and slides between two scene snapshots; the live scenes are not
+redrawn while a transition runs
+"""
+
+import pygame
+
+
+def snapshot_scene(scene, size):
+    """Draw a scene once into an opaque surface"""
+    surface = pygame.Surface(size).convert()
+    scene.draw(surface)
+    return surface
+
+
+class Transition:
+    """Animated switch from an outgoing to an incoming scene snapshot
+    
+    kind is "fade", "slide_left" or "slide_right". Every frame costs two
+    blits: the snapshots are never redrawn, only re-positioned or given a
+    new surface alpha.
+    """
+    
+    KINDS = ("fade", "slide_left", "slide_right")
+    
+    def __init__(self, old_surface, new_surface, duration_ms, kind="fade"):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown transition: {kind}")
+        self.old_surface = old_surface
+        self.new_surface = new_surface
+        self.duration_ms = max(1, duration_ms)
+        self.kind = kind
+        self.start_time = pygame.time.get_ticks()
+    
+    @property
+    def progress(self):
+        """0.0 at the start, 1.0 when finished"""
+        return min(1.0, (pygame.time.get_ticks() - self.start_time) / self.duration_ms)
+    
+    @property
+    def done(self):
+        return self.progress >= 1.0
+    
+    def draw(self, surface):
+        """Blit both snapshots for the current progress"""
+        progress = self.progress
+        if self.kind == "fade":
+            surface.blit(self.old_surface, (0, 0))
+            self.new_surface.set_alpha(int(255 * progress))
+            surface.blit(self.new_surface, (0, 0))
+            return
+        
+        # 滑动: 新场景从一侧推入，旧场景同步移出
+        width = surface.get_width()
+        offset = int(width * progress)
+        if self.kind == "slide_left":
+            surface.blit(self.old_surface, (-offset, 0))
+            surface.blit(self.new_surface, (width - offset, 0))
+        else:
+            surface.blit(self.old_surface, (offset, 0))
+            surface.blit(self.new_surface, (offset - width, 0))
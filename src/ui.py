@@ -6,55 +6,192 @@ Contains buttons, text boxes and other UI elements
 
 import pygame
 from .config import *
+from .text_cache import text_cache, glyph_atlas, get_font
 
 
-class Button:
+# 每个字体的单词宽度缓存 font -> {word: width}
+_word_widths = {}
+_WORD_WIDTH_CACHE_LIMIT = 4096
+
+
+def measure_word(font, word):
+    """Width of a single word, memoized per font"""
+    widths = _word_widths.get(font)
+    if widths is None:
+        widths = _word_widths[font] = {}
+    width = widths.get(word)
+    if width is None:
+        if len(widths) >= _WORD_WIDTH_CACHE_LIMIT:
+            widths.clear()
+        width = widths[word] = font.size(word)[0]
+    return width
+
+
+def wrap_text(text, font, max_width):
+    """
+    Wrap text to max_width pixels
+    Each word is measured once and line widths are accumulated
+    incrementally, so wrapping is linear in the text length.
+    Newlines start new paragraphs; a word wider than max_width gets a
+    line of its own.
+    """
+    lines = []
+    space_width = measure_word(font, ' ')
+    
+    for paragraph in text.split('\n'):
+        current_line = []
+        line_width = 0
+        
+        for word in paragraph.split(' '):
+            word_width = measure_word(font, word)
+            if not current_line:
+                if word_width <= max_width:
+                    current_line = [word]
+                    line_width = word_width
+                else:
+                    # 单词本身太长
+                    lines.append(word)
+            elif line_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                line_width += space_width + word_width
+            else:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                line_width = word_width
+        
+        # 添加最后一行
+        if current_line:
+            lines.append(' '.join(current_line))
+    
+    return lines
+
+
+class Widget:
+    """UI组件基类
+    
+    Widgets render themselves once per visual state into a cached surface
+    and blit that cache every frame. Subclasses describe their appearance
+    in visual_state() and draw it in _render(); the cache is rebuilt only
+    when that state changes or mark_dirty() is called.
+    """
+    
+    # 可交互组件: 由输入分发器维护 is_hovered 并响应点击
+    interactive = False
+    
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+        self._cache = None
+        self._cache_state = None
+        self._drawn_bounds = None
+        self._force_dirty = True
+    
+    def visual_state(self):
+        """Hashable snapshot of everything that affects the widget's appearance"""
+        return (self.rect.size,)
+    
+    def bounds(self):
+        """Screen area covered when the widget is drawn"""
+        return self.rect
+    
+    def set_hovered(self, hovered):
+        """Hover enter/leave notification from the input dispatcher"""
+        self.is_hovered = hovered
+    
+    def mark_dirty(self):
+        """Force the cached surface to be re-rendered"""
+        self._force_dirty = True
+    
+    def is_dirty(self):
+        """Whether the widget looks different from when it was last drawn"""
+        return (self._force_dirty or self.visual_state() != self._cache_state
+                or self.bounds() != self._drawn_bounds)
+    
+    def dirty_rect(self):
+        """Region to repaint: old and new bounds combined"""
+        rect = self.bounds()
+        if self._drawn_bounds is not None:
+            rect = rect.union(self._drawn_bounds)
+        return rect
+    
+    def get_surface(self):
+        """Return the cached surface, re-rendering it if the state changed"""
+        state = self.visual_state()
+        if self._cache is None or self._force_dirty or state != self._cache_state:
+            bounds = self.bounds()
+            self._cache = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            self._render(self._cache, self.rect.move(-bounds.x, -bounds.y))
+            self._cache_state = state
+            self._force_dirty = False
+        return self._cache
+    
+    def draw(self, surface):
+        """绘制组件"""
+        cache = self.get_surface()
+        self._drawn_bounds = self.bounds().copy()
+        surface.blit(cache, self._drawn_bounds)
+    
+    def _render(self, surface, rect):
+        """
+        Draw the widget onto its cache surface
+        rect is the widget rect in cache-surface coordinates
+        """
+        pass
+
+
+class Button(Widget):
     """按钮类"""
     
+    interactive = True
+    
     def __init__(self, x, y, width, height, text, font_size=24, 
                  color=BLUE, hover_color=LIGHT_GRAY, text_color=WHITE):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(font_size)
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
         self.is_hovered = False
     
-    def draw(self, surface):
+    def visual_state(self):
+        return (self.rect.size, self.text, self.color, self.hover_color,
+                self.text_color, self.is_hovered)
+    
+    def bounds(self):
+        # 包含阴影偏移
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width + 4, self.rect.height + 4)
+    
+    def _render(self, surface, rect):
         """绘制按钮"""
         # 绘制阴影
-        shadow_rect = self.rect.copy()
+        shadow_rect = rect.copy()
         shadow_rect.x += 4
         shadow_rect.y += 4
         pygame.draw.rect(surface, (50, 50, 50), shadow_rect, border_radius=5)
         
         color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
+        pygame.draw.rect(surface, color, rect, border_radius=5)
+        pygame.draw.rect(surface, BLACK, rect, 2, border_radius=5)
         
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        text_surface = text_cache.render(self.text, self.font_size, self.text_color)
+        text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
     
     def handle_event(self, event):
-        """处理事件"""
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered:
-                return True
-        return False
+        """处理事件 (is_hovered 由输入分发器设置)"""
+        return event.type == pygame.MOUSEBUTTONDOWN and self.is_hovered
 
 
-class TextBox:
+class TextBox(Widget):
     """文本框类"""
     
     def __init__(self, x, y, width, height, text="", font_size=24, 
                  bg_color=(30, 30, 40, 230), text_color=(255, 255, 255), padding=20):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.text = text
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(font_size)
         self.bg_color = bg_color
         self.text_color = text_color
         self.padding = padding
@@ -63,107 +200,80 @@ class TextBox:
         self._wrap_text()
     
     def set_text(self, text):
-        """设置文本"""
+        """设置文本 (换行并预渲染到缓存表面)"""
         self.text = text
         self._wrap_text()
-        
+        self.get_surface()
+    
     def _wrap_text(self):
         """处理文本自动换行"""
-        self.wrapped_lines = []
-        if not self.text:
-            return
-            
         # 可用宽度
         max_width = self.rect.width - self.padding * 2
-        
-        # 按换行符分割段落
-        paragraphs = self.text.split('\n')
-        
-        for paragraph in paragraphs:
-            words = paragraph.split(' ')
-            current_line = []
-            
-            for word in words:
-                # 尝试添加单词
-                test_line = ' '.join(current_line + [word])
-                # 检查宽度
-                if self.font.size(test_line)[0] <= max_width:
-                    current_line.append(word)
-                else:
-                    # 如果当前行不为空，先保存当前行
-                    if current_line:
-                        self.wrapped_lines.append(' '.join(current_line))
-                        current_line = [word]
-                    else:
-                        # 单词本身太长
-                        self.wrapped_lines.append(word)
-                        current_line = []
-            
-            # 添加最后一行
-            if current_line:
-                self.wrapped_lines.append(' '.join(current_line))
+        self.wrapped_lines = wrap_text(self.text, self.font, max_width) if self.text else []
     
-    def draw(self, surface):
+    def visual_state(self):
+        return (self.rect.size, self.text, self.bg_color, self.text_color)
+    
+    def _render(self, surface, rect):
         """绘制文本框"""
         # 1. 绘制半透明背景
-        s = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        
-        # 填充背景色
         if len(self.bg_color) == 4:
-            s.fill(self.bg_color)
+            surface.fill(self.bg_color, rect)
         else:
-            s.fill((*self.bg_color, 255))
-            
-        # 绘制边框
-        pygame.draw.rect(s, (200, 200, 200), s.get_rect(), 2, border_radius=10)
+            surface.fill((*self.bg_color, 255), rect)
         
-        # 将surface blit到主屏幕
-        surface.blit(s, (self.rect.x, self.rect.y))
+        # 绘制边框
+        pygame.draw.rect(surface, (200, 200, 200), rect, 2, border_radius=10)
         
         # 2. 绘制文本
-        y_offset = self.rect.y + self.padding
+        y_offset = rect.y + self.padding
         line_height = self.font.get_height() + self.line_spacing
         
         for line in self.wrapped_lines:
             # 检查是否超出高度
-            if y_offset + line_height > self.rect.bottom - self.padding:
+            if y_offset + line_height > rect.bottom - self.padding:
                 break
-                
-            text_surface = self.font.render(line, True, self.text_color)
-            surface.blit(text_surface, (self.rect.x + self.padding, y_offset))
+            
+            text_surface = text_cache.render(line, self.font_size, self.text_color)
+            surface.blit(text_surface, (rect.x + self.padding, y_offset))
             y_offset += line_height
 
 
-class StatusBar:
+class StatusBar(Widget):
     """状态栏类"""
     
     def __init__(self, x, y, width, height, label, value, max_value, 
                  bar_color=GREEN, bg_color=(60, 60, 60), icon_text=""):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.label = label
         self.value = value
         self.max_value = max_value
         self.bar_color = bar_color
         self.bg_color = bg_color
         self.icon_text = icon_text
-        self.font = pygame.font.Font(None, 22)
+        self.font_size = 22
+        self.font = get_font(22)
     
     def update(self, value):
         """更新数值"""
         self.value = value
     
-    def draw(self, surface):
+    def visual_state(self):
+        return (self.rect.size, self.label, int(self.value), int(self.max_value),
+                self.bar_color, self.bg_color, self.icon_text)
+    
+    def _render(self, surface, rect):
         """绘制状态栏"""
         # 绘制背景容器 (圆角)
-        pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, (200, 200, 200), self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, self.bg_color, rect, border_radius=8)
+        pygame.draw.rect(surface, (200, 200, 200), rect, 2, border_radius=8)
         
         # 内部进度条区域
         padding = 4
-        inner_width = self.rect.width - padding * 2
-        inner_height = self.rect.height - padding * 2
-        inner_x = self.rect.x + padding
-        inner_y = self.rect.y + padding
+        inner_width = rect.width - padding * 2
+        inner_height = rect.height - padding * 2
+        inner_x = rect.x + padding
+        inner_y = rect.y + padding
         
         # 绘制槽位背景
         pygame.draw.rect(surface, (30, 30, 30), 
@@ -194,71 +304,80 @@ class StatusBar:
         # 绘制文字 (带阴影)
         text = f"{self.icon_text} {self.label}: {int(self.value)}/{int(self.max_value)}"
         
+        # 数值频繁变化，用字形图集排版，避免每次重新渲染TTF
+        text_rect = pygame.Rect((0, 0), glyph_atlas.size(text, self.font_size, WHITE))
+        text_rect.center = rect.center
+        
         # 阴影
-        text_shadow = self.font.render(text, True, (0, 0, 0))
-        text_rect_shadow = text_shadow.get_rect(center=(self.rect.centerx + 1, self.rect.centery + 1))
-        surface.blit(text_shadow, text_rect_shadow)
+        glyph_atlas.render_to(surface, text, text_rect.move(1, 1).topleft, self.font_size, (0, 0, 0))
         
         # 正文
-        text_surface = self.font.render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        glyph_atlas.render_to(surface, text, text_rect.topleft, self.font_size, WHITE)
 
 
-class InfoBadge:
+class InfoBadge(Widget):
     """信息徽章类 (用于心情和金钱)"""
     
     def __init__(self, x, y, width, height, label, value_text, 
                  color=(100, 100, 255), icon_text=""):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.label = label
         self.value_text = value_text
         self.color = color
         self.icon_text = icon_text
-        self.font = pygame.font.Font(None, 22)
+        self.font_size = 22
+        self.font = get_font(22)
     
     def update(self, value_text, color=None):
         self.value_text = value_text
         if color:
             self.color = color
-            
-    def draw(self, surface):
+    
+    def visual_state(self):
+        return (self.rect.size, self.label, self.value_text, self.color, self.icon_text)
+    
+    def _render(self, surface, rect):
         # 背景 (带边框)
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, WHITE, self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, self.color, rect, border_radius=8)
+        pygame.draw.rect(surface, WHITE, rect, 2, border_radius=8)
         
         # 高光
-        highlight_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, self.rect.height // 2)
-        highlight_surf = pygame.Surface((self.rect.width, self.rect.height // 2), pygame.SRCALPHA)
+        highlight_rect = pygame.Rect(rect.x, rect.y, rect.width, rect.height // 2)
+        highlight_surf = pygame.Surface((rect.width, rect.height // 2), pygame.SRCALPHA)
         highlight_surf.fill((255, 255, 255, 40))
         surface.blit(highlight_surf, highlight_rect)
         
         # 文字
         text = f"{self.icon_text} {self.label}: {self.value_text}"
         
+        text_rect = pygame.Rect((0, 0), glyph_atlas.size(text, self.font_size, WHITE))
+        text_rect.center = rect.center
+        
         # 阴影
-        text_shadow = self.font.render(text, True, (0, 0, 0))
-        text_rect_shadow = text_shadow.get_rect(center=(self.rect.centerx + 1, self.rect.centery + 1))
-        surface.blit(text_shadow, text_rect_shadow)
+        glyph_atlas.render_to(surface, text, text_rect.move(1, 1).topleft, self.font_size, (0, 0, 0))
         
         # 正文
-        text_surf = self.font.render(text, True, WHITE)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        glyph_atlas.render_to(surface, text, text_rect.topleft, self.font_size, WHITE)
 
 
-class ItemSlot:
+class ItemSlot(Widget):
     """物品槽类"""
     
+    interactive = True
+    
     def __init__(self, x, y, width, height, item_name, count, font_size=18):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.item_name = item_name
         self.count = count
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(font_size)
         self.is_hovered = False
         self.is_selected = False
     
-    def draw(self, surface):
+    def visual_state(self):
+        return (self.rect.size, self.item_name, self.count, self.is_hovered, self.is_selected)
+    
+    def _render(self, surface, rect):
         """绘制物品槽"""
         # 背景色
         if self.is_selected:
@@ -268,29 +387,23 @@ class ItemSlot:
         else:
             bg_color = WHITE
         
-        pygame.draw.rect(surface, bg_color, self.rect, border_radius=3)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=3)
+        pygame.draw.rect(surface, bg_color, rect, border_radius=3)
+        pygame.draw.rect(surface, BLACK, rect, 2, border_radius=3)
         
         # 物品名称
         text = f"{self.item_name} x{self.count}"
-        text_surface = self.font.render(text, True, BLACK)
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        text_surface = text_cache.render(text, self.font_size, BLACK)
+        text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
     
     def handle_event(self, event):
-        """处理事件"""
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered:
-                return True
-        return False
+        """处理事件 (is_hovered 由输入分发器设置)"""
+        return event.type == pygame.MOUSEBUTTONDOWN and self.is_hovered
 
 
 def draw_text(surface, text, x, y, font_size=24, color=BLACK, center=False):
     """绘制文本的辅助函数"""
-    font = pygame.font.Font(None, font_size)
-    text_surface = font.render(text, True, color)
+    text_surface = text_cache.render(text, font_size, color)
     if center:
         text_rect = text_surface.get_rect(center=(x, y))
         surface.blit(text_surface, text_rect)
@@ -298,30 +411,159 @@ def draw_text(surface, text, x, y, font_size=24, color=BLACK, center=False):
         surface.blit(text_surface, (x, y))
 
 
-def draw_multiline_text(surface, text, x, y, width, font_size=20, color=BLACK):
-    """绘制多行文本"""
-    font = pygame.font.Font(None, font_size)
-    words = text.split(' ')
-    lines = []
-    current_line = []
-    
-    for word in words:
-        current_line.append(word)
-        line_text = ' '.join(current_line)
-        if font.size(line_text)[0] > width:
-            if len(current_line) > 1:
-                current_line.pop()
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                lines.append(line_text)
-                current_line = []
+def draw_glyph_text(surface, text, x, y, font_size=24, color=BLACK, center=False):
+    """
+    Like draw_text, but laid out from the glyph atlas
+    Use for HUD text and numbers that change often
+    """
+    if center:
+        width, height = glyph_atlas.size(text, font_size, color)
+        x, y = x - width // 2, y - height // 2
+    glyph_atlas.render_to(surface, text, (x, y), font_size, color)
+
+
+class VirtualGrid:
+    """虚拟化滚动网格
+    
+    Only the rows inside the viewport get slot widgets. Slots are created
+    once by create_slot() and recycled while scrolling: bind_slot(slot,
+    item) copies everything the slot shows from the model, so selection
+    state lives in the scene's model rather than in slot objects.
+    """
+    
+    def __init__(self, x, y, width, height, cell_width, cell_height, cols,
+                 x_spacing, y_spacing, create_slot, bind_slot):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.cols = cols
+        self.x_spacing = x_spacing
+        self.y_spacing = y_spacing
+        self.create_slot = create_slot  # create_slot(x, y, width, height) -> widget
+        self.bind_slot = bind_slot      # bind_slot(slot, item)
+        self.visible_rows = max(1, (height + y_spacing) // (cell_height + y_spacing))
+        self.items = []
+        self.scroll_row = 0
+        self._pool = []
+        self._visible = []  # [(slot, item)]
+        self._scrollbar = None
+        self._scrollbar_state = None
+    
+    @property
+    def row_count(self):
+        return (len(self.items) + self.cols - 1) // self.cols
+    
+    @property
+    def max_scroll_row(self):
+        return max(0, self.row_count - self.visible_rows)
+    
+    def set_items(self, items):
+        """Replace the model items and scroll back to the top"""
+        self.items = list(items)
+        self.scroll_row = 0
+        self.refresh()
+    
+    def scroll(self, rows):
+        """Scroll by rows; returns True if the visible range changed"""
+        new_row = max(0, min(self.max_scroll_row, self.scroll_row + rows))
+        if new_row == self.scroll_row:
+            return False
+        self.scroll_row = new_row
+        self.refresh()
+        return True
+    
+    def refresh(self):
+        """Re-bind visible slots from the model"""
+        start = self.scroll_row * self.cols
+        visible_items = self.items[start:start + self.visible_rows * self.cols]
+        
+        # 按需创建槽位，滚动时复用
+        while len(self._pool) < len(visible_items):
+            self._pool.append(self.create_slot(0, 0, self.cell_width, self.cell_height))
+        
+        self._visible = []
+        for i, item in enumerate(visible_items):
+            slot = self._pool[i]
+            slot.rect.topleft = (self.rect.x + (i % self.cols) * (self.cell_width + self.x_spacing),
+                                 self.rect.y + (i // self.cols) * (self.cell_height + self.y_spacing))
+            self.bind_slot(slot, item)
+            self._visible.append((slot, item))
     
-    if current_line:
-        lines.append(' '.join(current_line))
+    def slots(self):
+        """Slot widgets currently visible"""
+        return [slot for slot, _ in self._visible]
     
+    def visible(self):
+        """(slot, item) pairs currently visible"""
+        return list(self._visible)
+    
+    def handle_event(self, event):
+        """
+        Handle scrolling and slot events
+        Returns the clicked item, "scrolled" if the view moved, or None
+        The caller must invalidate its layout after a scroll
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            # pos 由输入分发器补上 (当前指针位置)
+            if self.rect.collidepoint(event.pos) and self.scroll(-event.y):
+                return "scrolled"
+            return None
+        elif event.type == pygame.KEYDOWN:
+            step = {pygame.K_UP: -1, pygame.K_DOWN: 1,
+                    pygame.K_PAGEUP: -self.visible_rows,
+                    pygame.K_PAGEDOWN: self.visible_rows}.get(event.key)
+            if step and self.scroll(step):
+                return "scrolled"
+            return None
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button not in (1, 3):
+            # pygame 2 每格滚轮还会发送按键4/5，不能当作点击槽位
+            return None
+        
+        for slot, item in self._visible:
+            if slot.handle_event(event):
+                return item
+        return None
+    
+    def _scrollbar_surface(self):
+        """Cached scrollbar thumb surface"""
+        state = (self.scroll_row, self.max_scroll_row, self.row_count)
+        if state != self._scrollbar_state:
+            track = pygame.Rect(0, 0, 6, self.rect.height)
+            self._scrollbar = pygame.Surface(track.size, pygame.SRCALPHA)
+            self._scrollbar.fill((0, 0, 0, 90))
+            thumb_h = max(20, track.height * self.visible_rows // self.row_count)
+            thumb_y = (track.height - thumb_h) * self.scroll_row // self.max_scroll_row
+            pygame.draw.rect(self._scrollbar, (80, 80, 80, 200), (0, thumb_y, 6, thumb_h), border_radius=3)
+            self._scrollbar_state = state
+        return self._scrollbar
+    
+    def draw(self, surface):
+        """绘制可见槽位和滚动条"""
+        for slot, _ in self._visible:
+            slot.draw(surface)
+        if self.max_scroll_row > 0:
+            surface.blit(self._scrollbar_surface(), (self.rect.right - 6, self.rect.y))
+
+
+def render_text_block(text, font, width, color=BLACK, line_spacing=2):
+    """
+    Render wrapped text into a new transparent surface
+    Uses only the given font, so it is safe to call from a worker thread
+    with a font instance owned by that thread.
+    """
+    lines = wrap_text(text, font, width)
+    line_height = font.get_height() + line_spacing
+    block = pygame.Surface((width, max(1, line_height * len(lines))), pygame.SRCALPHA)
+    for i, line in enumerate(lines):
+        block.blit(font.render(line, True, color), (0, i * line_height))
+    return block
+
+
+def draw_multiline_text(surface, text, x, y, width, font_size=20, color=BLACK):
+    """绘制多行文本"""
+    font = get_font(font_size)
     y_offset = y
-    for line in lines:
-        text_surface = font.render(line, True, color)
+    for line in wrap_text(text, font, width):
+        text_surface = text_cache.render(line, font_size, color)
         surface.blit(text_surface, (x, y_offset))
         y_offset += font.get_height() + 2